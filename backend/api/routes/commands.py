@@ -1,6 +1,11 @@
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
+from api.parsing import raw_body
+from api import websocket as ws
+
 router = APIRouter(tags=["Commands"])
 
 # This will be set from main.py
@@ -16,23 +21,8 @@ class JogSpeedRequest(BaseModel):
     velocity: float  # mm/min
 
 
-class CommandResponse(BaseModel):
-    success: bool
-    message: str
-
-
-class ModeResponse(BaseModel):
-    remote_mode: bool
-    mode: str  # "local" or "remote"
-
-
-class SafetyStatus(BaseModel):
-    e_stop: bool
-    upper_limit: bool
-    lower_limit: bool
-    home: bool
-    safety_ok: bool
-    motion_allowed: bool
+class StepDistanceRequest(BaseModel):
+    distance: float  # mm (0.1 - 100)
 
 
 def _check_service():
@@ -40,289 +30,199 @@ def _check_service():
         raise HTTPException(status_code=503, detail="Command service not initialized")
 
 
-# ========== TARE / ZERO ==========
-
-@router.post("/tare", response_model=CommandResponse)
-async def tare_loadcell():
-    """Zero/Tare the load cell - DB2.DBX60.0"""
-    _check_service()
-    result = command_service.tare_loadcell()
-    return CommandResponse(
-        success=result["success"],
-        message=result["message"]
-    )
-
-
-@router.post("/zero-position", response_model=CommandResponse)
-async def zero_position():
-    """Zero the position display - DB4.DBX59.7"""
-    _check_service()
-    result = command_service.zero_position()
-    return CommandResponse(
-        success=result["success"],
-        message=result["message"]
-    )
-
-
-# ========== Safety Status ==========
-
-@router.get("/safety", response_model=SafetyStatus)
+async def _plc(fn, *args):
+    """Run a blocking CommandService call on the PLC connector's worker thread"""
+    return await command_service.plc.run(fn, *args)
+
+
+# ========== One-shot command dispatch ==========
+#
+# The one-shot POST commands differ only in which CommandService method
+# they call and how the result maps to a response body, so they are
+# registered from a single table instead of ~20 near-identical handlers.
+# One shared code path stays warm in the interpreter and the route table
+# stays small.
+
+# Response bodies for endpoints whose message depends only on success are
+# constant - encode them once at import time instead of per request.
+def _const_bodies(ok_msg: str, fail_msg: str) -> tuple[bytes, bytes]:
+    return (
+        orjson.dumps({"success": True, "message": ok_msg}),
+        orjson.dumps({"success": False, "message": fail_msg}),
+    )
+
+
+def _dict_response(result):
+    """Service returned a dict carrying its own message"""
+    return ORJSONResponse({
+        "success": result["success"],
+        "message": result["message"]
+    })
+
+
+def _const_response(bodies):
+    """Service returned a bool (or a dict with just success) - body is constant"""
+    def respond(result):
+        success = result if isinstance(result, bool) else result.get("success", False)
+        return Response(
+            content=bodies[0] if success else bodies[1],
+            media_type="application/json"
+        )
+    return respond
+
+
+def _jog_start_response(ok_msg):
+    """Jog start: rejection dicts carry a message, plain success does not"""
+    def respond(result):
+        success = result.get("success", False)
+        return ORJSONResponse({
+            "success": success,
+            "message": result.get("message", ok_msg if success else "Failed")
+        })
+    return respond
+
+
+def _step_response(ok_msg):
+    """Step commands report failures under an 'error' key"""
+    def respond(result):
+        success = result["success"]
+        return ORJSONResponse({
+            "success": success,
+            "message": ok_msg if success else result.get("error", "Failed")
+        })
+    return respond
+
+
+# path -> (invoke, respond, summary)
+_ACTIONS = {
+    "tare": (lambda s: s.tare_loadcell(), _dict_response,
+             "Zero/Tare the load cell - DB2.DBX60.0"),
+    "zero-position": (lambda s: s.zero_position(), _dict_response,
+                      "Zero the position display - DB4.DBX59.7"),
+    "command/start": (lambda s: s.start_test(), _dict_response,
+                      "Start automated test"),
+    "command/stop": (lambda s: s.stop(),
+                     _const_response(_const_bodies("Emergency stop executed", "Failed to execute stop")),
+                     "Emergency stop - stops all movement"),
+    "command/home": (lambda s: s.home(), _dict_response,
+                     "Move to home position"),
+    "servo/enable": (lambda s: s.enable_servo(),
+                     _const_response(_const_bodies("Servo enabled", "Failed to enable servo")),
+                     "Enable servo motor"),
+    "servo/disable": (lambda s: s.disable_servo(),
+                      _const_response(_const_bodies("Servo disabled", "Failed to disable servo")),
+                      "Disable servo motor"),
+    "servo/reset": (lambda s: s.reset_alarm(),
+                    _const_response(_const_bodies("Alarm reset", "Failed to reset alarm")),
+                    "Reset servo alarm"),
+    "jog/forward/start": (lambda s: s.jog_forward(True),
+                          _jog_start_response("Jog forward started"),
+                          "Start jog forward (down)"),
+    "jog/forward/stop": (lambda s: s.jog_forward(False),
+                         _const_response(_const_bodies("Jog forward stopped", "Jog forward stopped")),
+                         "Stop jog forward"),
+    "jog/backward/start": (lambda s: s.jog_backward(True),
+                           _jog_start_response("Jog backward started"),
+                           "Start jog backward (up)"),
+    "jog/backward/stop": (lambda s: s.jog_backward(False),
+                          _const_response(_const_bodies("Jog backward stopped", "Jog backward stopped")),
+                          "Stop jog backward"),
+    "clamp/upper/lock": (lambda s: s.lock_upper(),
+                         _const_response(_const_bodies("Upper clamp locked", "Failed to lock upper clamp")),
+                         "Lock upper clamp"),
+    "clamp/lower/lock": (lambda s: s.lock_lower(),
+                         _const_response(_const_bodies("Lower clamp locked", "Failed to lock lower clamp")),
+                         "Lock lower clamp"),
+    "clamp/unlock": (lambda s: s.unlock_all(),
+                     _const_response(_const_bodies("All clamps unlocked", "Failed to unlock clamps")),
+                     "Unlock all clamps"),
+    "mode/local": (lambda s: s.set_remote_mode(False), _dict_response,
+                   "Switch to Local mode (Physical buttons)"),
+    "mode/remote": (lambda s: s.set_remote_mode(True), _dict_response,
+                    "Switch to Remote mode (Web interface)"),
+    "step/forward": (lambda s: s.step_forward(), _step_response("Step forward"),
+                     "Execute one step down (toward sample)"),
+    "step/backward": (lambda s: s.step_backward(), _step_response("Step backward"),
+                      "Execute one step up (away from sample)"),
+}
+
+
+def _make_handler(invoke, respond):
+    async def handler():
+        _check_service()
+        result = await _plc(invoke, command_service)
+        success = result if isinstance(result, bool) else result.get("success", False)
+        if success:
+            # Wake the broadcaster so the write shows up on the next tick
+            # instead of after up to a full poll interval
+            ws.notify_data_changed()
+        return respond(result)
+    return handler
+
+
+for _path, (_invoke, _respond, _summary) in _ACTIONS.items():
+    router.add_api_route(
+        f"/{_path}",
+        _make_handler(_invoke, _respond),
+        methods=["POST"],
+        summary=_summary,
+    )
+
+
+# ========== Endpoints with request bodies or non-command responses ==========
+
+@router.get("/safety")
 async def get_safety_status():
     """Get all safety status bits"""
     _check_service()
-    return command_service.get_safety_status()
-
-
-# ========== Test Control ==========
-
-@router.post("/command/start", response_model=CommandResponse)
-async def start_test():
-    """Start automated test"""
-    _check_service()
-    result = command_service.start_test()
-    return CommandResponse(
-        success=result["success"],
-        message=result["message"]
-    )
-
-
-@router.post("/command/stop", response_model=CommandResponse)
-async def emergency_stop():
-    """Emergency stop - stops all movement"""
-    _check_service()
-    success = command_service.stop()
-    return CommandResponse(
-        success=success,
-        message="Emergency stop executed" if success else "Failed to execute stop"
-    )
-
-
-@router.post("/command/home", response_model=CommandResponse)
-async def go_home():
-    """Move to home position"""
-    _check_service()
-    result = command_service.home()
-    return CommandResponse(
-        success=result["success"],
-        message=result["message"]
-    )
-
-
-# ========== Servo Control ==========
+    return ORJSONResponse(await _plc(command_service.get_safety_status))
 
-@router.post("/servo/enable", response_model=CommandResponse)
-async def enable_servo():
-    """Enable servo motor"""
-    _check_service()
-    success = command_service.enable_servo()
-    return CommandResponse(
-        success=success,
-        message="Servo enabled" if success else "Failed to enable servo"
-    )
-
-
-@router.post("/servo/disable", response_model=CommandResponse)
-async def disable_servo():
-    """Disable servo motor"""
-    _check_service()
-    success = command_service.disable_servo()
-    return CommandResponse(
-        success=success,
-        message="Servo disabled" if success else "Failed to disable servo"
-    )
 
-
-@router.post("/servo/reset", response_model=CommandResponse)
-async def reset_servo_alarm():
-    """Reset servo alarm"""
-    _check_service()
-    success = command_service.reset_alarm()
-    return CommandResponse(
-        success=success,
-        message="Alarm reset" if success else "Failed to reset alarm"
-    )
-
-
-# ========== Jog Control ==========
-
-@router.post("/jog/speed", response_model=CommandResponse)
-async def set_jog_speed(request: JogSpeedRequest):
+@router.post("/jog/speed")
+async def set_jog_speed(request: JogSpeedRequest = Depends(raw_body(JogSpeedRequest))):
     """Set jog velocity (mm/min)"""
     _check_service()
     if request.velocity < 1.2 or request.velocity > 6000:
         raise HTTPException(status_code=400, detail="Velocity must be between 1.2 and 6000 mm/min")
 
-    success = command_service.set_jog_velocity(request.velocity)
-    return CommandResponse(
-        success=success,
-        message=f"Jog speed set to {request.velocity} mm/min" if success else "Failed to set jog speed"
-    )
-
-
-@router.post("/jog/forward/start", response_model=CommandResponse)
-async def jog_forward_start():
-    """Start jog forward (down)"""
-    _check_service()
-    result = command_service.jog_forward(True)
-    return CommandResponse(
-        success=result.get("success", False),
-        message=result.get("message", "Jog forward started") if result.get("success") else result.get("message", "Failed")
-    )
+    success = await _plc(command_service.set_jog_velocity, request.velocity)
+    if success:
+        ws.notify_data_changed()
+    return ORJSONResponse({
+        "success": success,
+        "message": f"Jog speed set to {request.velocity} mm/min" if success else "Failed to set jog speed"
+    })
 
 
-@router.post("/jog/forward/stop", response_model=CommandResponse)
-async def jog_forward_stop():
-    """Stop jog forward"""
-    _check_service()
-    result = command_service.jog_forward(False)
-    return CommandResponse(
-        success=result.get("success", False),
-        message="Jog forward stopped"
-    )
-
-
-@router.post("/jog/backward/start", response_model=CommandResponse)
-async def jog_backward_start():
-    """Start jog backward (up)"""
-    _check_service()
-    result = command_service.jog_backward(True)
-    return CommandResponse(
-        success=result.get("success", False),
-        message=result.get("message", "Jog backward started") if result.get("success") else result.get("message", "Failed")
-    )
-
-
-@router.post("/jog/backward/stop", response_model=CommandResponse)
-async def jog_backward_stop():
-    """Stop jog backward"""
-    _check_service()
-    result = command_service.jog_backward(False)
-    return CommandResponse(
-        success=result.get("success", False),
-        message="Jog backward stopped"
-    )
-
-
-# ========== Clamp Control ==========
-
-@router.post("/clamp/upper/lock", response_model=CommandResponse)
-async def lock_upper_clamp():
-    """Lock upper clamp"""
-    _check_service()
-    success = command_service.lock_upper()
-    return CommandResponse(
-        success=success,
-        message="Upper clamp locked" if success else "Failed to lock upper clamp"
-    )
-
-
-@router.post("/clamp/lower/lock", response_model=CommandResponse)
-async def lock_lower_clamp():
-    """Lock lower clamp"""
-    _check_service()
-    success = command_service.lock_lower()
-    return CommandResponse(
-        success=success,
-        message="Lower clamp locked" if success else "Failed to lock lower clamp"
-    )
-
-
-@router.post("/clamp/unlock", response_model=CommandResponse)
-async def unlock_all_clamps():
-    """Unlock all clamps"""
-    _check_service()
-    success = command_service.unlock_all()
-    return CommandResponse(
-        success=success,
-        message="All clamps unlocked" if success else "Failed to unlock clamps"
-    )
-
-
-# ========== Mode Control ==========
-
-@router.get("/mode", response_model=ModeResponse)
+@router.get("/mode")
 async def get_mode():
     """Get current control mode"""
     _check_service()
-    remote_mode = command_service.get_remote_mode()
-    return ModeResponse(
-        remote_mode=remote_mode,
-        mode="remote" if remote_mode else "local"
-    )
-
-
-@router.post("/mode/local", response_model=CommandResponse)
-async def set_local_mode():
-    """Switch to Local mode (Physical buttons)"""
-    _check_service()
-    result = command_service.set_remote_mode(False)
-    return CommandResponse(
-        success=result["success"],
-        message=result["message"]
-    )
-
-
-@router.post("/mode/remote", response_model=CommandResponse)
-async def set_remote_mode():
-    """Switch to Remote mode (Web interface)"""
-    _check_service()
-    result = command_service.set_remote_mode(True)
-    return CommandResponse(
-        success=result["success"],
-        message=result["message"]
-    )
-
-
-# ========== Step Movement Control ==========
-
-class StepDistanceRequest(BaseModel):
-    distance: float  # mm (0.1 - 100)
-
+    remote_mode = await _plc(command_service.get_remote_mode)
+    return ORJSONResponse({
+        "remote_mode": remote_mode,
+        "mode": "remote" if remote_mode else "local"
+    })
 
-class StepStatusResponse(BaseModel):
-    distance: float
-    active: bool
-    done: bool
 
-
-@router.post("/step/distance", response_model=CommandResponse)
-async def set_step_distance(request: StepDistanceRequest):
+@router.post("/step/distance")
+async def set_step_distance(request: StepDistanceRequest = Depends(raw_body(StepDistanceRequest))):
     """Set step distance in mm (0.1 - 100)"""
     _check_service()
     if request.distance < 0.1 or request.distance > 100:
         raise HTTPException(status_code=400, detail="Distance must be between 0.1 and 100 mm")
-    
-    result = command_service.set_step_distance(request.distance)
-    return CommandResponse(
-        success=result["success"],
-        message=f"Step distance set to {result.get('distance', request.distance)} mm" if result["success"] else result.get("message", "Failed")
-    )
-
 
-@router.post("/step/forward", response_model=CommandResponse)
-async def step_forward():
-    """Execute one step down (toward sample)"""
-    _check_service()
-    result = command_service.step_forward()
-    return CommandResponse(
-        success=result["success"],
-        message="Step forward" if result["success"] else result.get("error", "Failed")
-    )
-
-
-@router.post("/step/backward", response_model=CommandResponse)
-async def step_backward():
-    """Execute one step up (away from sample)"""
-    _check_service()
-    result = command_service.step_backward()
-    return CommandResponse(
-        success=result["success"],
-        message="Step backward" if result["success"] else result.get("error", "Failed")
-    )
+    result = await _plc(command_service.set_step_distance, request.distance)
+    if result["success"]:
+        ws.notify_data_changed()
+    return ORJSONResponse({
+        "success": result["success"],
+        "message": f"Step distance set to {result.get('distance', request.distance)} mm" if result["success"] else result.get("message", "Failed")
+    })
 
 
-@router.get("/step/status", response_model=StepStatusResponse)
+@router.get("/step/status")
 async def get_step_status():
     """Get current step movement status"""
     _check_service()
-    return command_service.get_step_status()
+    return ORJSONResponse(await _plc(command_service.get_step_status))
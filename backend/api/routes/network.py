@@ -2,16 +2,29 @@
 Network Configuration API - WiFi and LAN settings
 """
 
-import subprocess
+import asyncio
+import ipaddress
 import os
+import re
 import logging
 from typing import Optional
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from pydantic import BaseModel
 
+from api.parsing import raw_body
+
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/network", tags=["Network"])
 
+# Full paths for system commands, resolved once at import
+_CMD_PATHS = {
+    "nmcli": "/usr/bin/nmcli",
+    "ip": "/usr/sbin/ip",
+    "sudo": "/usr/bin/sudo",
+    "iwlist": "/usr/sbin/iwlist",
+}
+_RUN_ENV = {**os.environ, "PATH": "/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin"}
+
 
 class WifiConnectRequest(BaseModel):
     ssid: str
@@ -25,73 +38,94 @@ class LanConfigRequest(BaseModel):
     gateway: Optional[str] = None
 
 
-def run_command(cmd: list[str], timeout: int = 30) -> tuple[bool, str]:
-    """Run a shell command and return success status and output"""
-    # Full paths for system commands
-    cmd_paths = {
-        "nmcli": "/usr/bin/nmcli",
-        "ip": "/usr/sbin/ip",
-        "sudo": "/usr/bin/sudo",
-        "iwlist": "/usr/sbin/iwlist",
-    }
-
+async def run_command(cmd: list[str], timeout: int = 30) -> tuple[bool, str]:
+    """Run a shell command without blocking the event loop"""
     # Replace command with full path if available
-    if cmd and cmd[0] in cmd_paths:
-        cmd = [cmd_paths[cmd[0]]] + cmd[1:]
-    elif cmd and len(cmd) > 1 and cmd[0] == "sudo" and cmd[1] in cmd_paths:
-        cmd = [cmd_paths["sudo"], cmd_paths[cmd[1]]] + cmd[2:]
+    if cmd and cmd[0] in _CMD_PATHS:
+        cmd = [_CMD_PATHS[cmd[0]]] + cmd[1:]
+    elif cmd and len(cmd) > 1 and cmd[0] == "sudo" and cmd[1] in _CMD_PATHS:
+        cmd = [_CMD_PATHS["sudo"], _CMD_PATHS[cmd[1]]] + cmd[2:]
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            env={**os.environ, "PATH": "/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin"}
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=_RUN_ENV
         )
-        output = result.stdout + result.stderr
-        return result.returncode == 0, output.strip()
-    except subprocess.TimeoutExpired:
-        return False, "Command timed out"
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return False, "Command timed out"
+        output = (stdout + stderr).decode()
+        return proc.returncode == 0, output.strip()
     except Exception as e:
         return False, str(e)
 
 
+# nmcli -t -f SSID,SIGNAL,SECURITY output: "ssid:signal:security" per line
+_SCAN_RE = re.compile(r"(?m)^([^:\n]*):(\d*):([^\n]*)$")
+
+# First "inet a.b.c.d/prefix" in `ip -4 addr show` output
+_INET_RE = re.compile(r"\binet (\d+\.\d+\.\d+\.\d+)(?:/(\d+))?")
+
+# WiFi scan cache - a hardware rescan takes seconds, so serve repeated
+# requests within the TTL from the previous result. The lock coalesces
+# concurrent scanners into a single nmcli invocation.
+SCAN_CACHE_TTL = 10.0  # seconds
+_scan_cache = {"ts": 0.0, "data": None}
+_scan_lock = asyncio.Lock()
+
+
 @router.get("/wifi/scan")
 async def scan_wifi_networks():
     """Scan for available WiFi networks"""
-    success, output = run_command(["sudo", "nmcli", "-t", "-f", "SSID,SIGNAL,SECURITY", "dev", "wifi", "list", "--rescan", "yes"])
+    loop = asyncio.get_running_loop()
+    if _scan_cache["data"] is not None and loop.time() - _scan_cache["ts"] < SCAN_CACHE_TTL:
+        return _scan_cache["data"]
+
+    async with _scan_lock:
+        # Re-check: another request may have refreshed the cache while we waited
+        if _scan_cache["data"] is not None and loop.time() - _scan_cache["ts"] < SCAN_CACHE_TTL:
+            return _scan_cache["data"]
+        return await _do_wifi_scan(loop)
+
+
+async def _do_wifi_scan(loop):
+    success, output = await run_command(["sudo", "nmcli", "-t", "-f", "SSID,SIGNAL,SECURITY", "dev", "wifi", "list", "--rescan", "yes"])
 
     if not success:
         raise HTTPException(status_code=500, detail=f"Failed to scan WiFi: {output}")
 
+    # One regex pass over the whole output instead of per-line splits,
+    # then dedupe after sorting so the strongest entry per SSID wins.
+    items = [
+        (int(signal) if signal else 0, ssid, security or "Open")
+        for ssid, signal, security in _SCAN_RE.findall(output)
+        if ssid and ssid != "--"
+    ]
+    items.sort(reverse=True)
+
     networks = []
     seen_ssids = set()
+    for signal, ssid, security in items:
+        if ssid not in seen_ssids:
+            seen_ssids.add(ssid)
+            networks.append({"ssid": ssid, "signal": signal, "security": security})
 
-    for line in output.split('\n'):
-        if line.strip():
-            parts = line.split(':')
-            if len(parts) >= 3:
-                ssid = parts[0].strip()
-                if ssid and ssid not in seen_ssids and ssid != "--":
-                    seen_ssids.add(ssid)
-                    networks.append({
-                        "ssid": ssid,
-                        "signal": int(parts[1]) if parts[1].isdigit() else 0,
-                        "security": parts[2] if len(parts) > 2 else "Open"
-                    })
-
-    # Sort by signal strength
-    networks.sort(key=lambda x: x["signal"], reverse=True)
-
-    return {"networks": networks}
+    result = {"networks": networks}
+    _scan_cache["data"] = result
+    _scan_cache["ts"] = loop.time()
+    return result
 
 
 @router.get("/wifi/status")
 async def get_wifi_status():
     """Get current WiFi connection status"""
     # Get active connections
-    success, output = run_command(["nmcli", "-t", "-f", "NAME,TYPE,DEVICE", "con", "show", "--active"])
+    success, output = await run_command(["nmcli", "-t", "-f", "NAME,TYPE,DEVICE", "con", "show", "--active"])
 
     wifi_connection = None
     for line in output.split('\n'):
@@ -102,12 +136,11 @@ async def get_wifi_status():
 
     # Get IP address from wlan0
     ip_address = None
-    success2, ip_output = run_command(["ip", "-4", "addr", "show", "wlan0"])
+    success2, ip_output = await run_command(["ip", "-4", "addr", "show", "wlan0"])
     if success2:
-        for line in ip_output.split('\n'):
-            if 'inet ' in line:
-                ip_address = line.split()[1].split('/')[0]
-                break
+        m = _INET_RE.search(ip_output)
+        if m:
+            ip_address = m.group(1)
 
     return {
         "connected": ip_address is not None,
@@ -117,12 +150,12 @@ async def get_wifi_status():
 
 
 @router.post("/wifi/connect")
-async def connect_wifi(request: WifiConnectRequest):
+async def connect_wifi(request: WifiConnectRequest = Depends(raw_body(WifiConnectRequest))):
     """Connect to a WiFi network"""
     logger.info(f"Attempting to connect to WiFi: {request.ssid}")
 
     # Try to connect
-    success, output = run_command([
+    success, output = await run_command([
         "sudo", "nmcli", "dev", "wifi", "connect",
         request.ssid, "password", request.password
     ], timeout=60)
@@ -138,7 +171,7 @@ async def connect_wifi(request: WifiConnectRequest):
 @router.post("/wifi/disconnect")
 async def disconnect_wifi():
     """Disconnect from current WiFi network"""
-    success, output = run_command(["sudo", "nmcli", "dev", "disconnect", "wlan0"])
+    success, output = await run_command(["sudo", "nmcli", "dev", "disconnect", "wlan0"])
 
     if not success:
         raise HTTPException(status_code=500, detail=f"Failed to disconnect: {output}")
@@ -158,7 +191,7 @@ async def get_lan_status():
     }
 
     # Get connection config
-    success, output = run_command(["nmcli", "-t", "-f", "ipv4.method,ipv4.addresses,ipv4.gateway", "con", "show", "Wired connection 1"])
+    success, output = await run_command(["nmcli", "-t", "-f", "ipv4.method,ipv4.addresses,ipv4.gateway", "con", "show", "Wired connection 1"])
 
     for line in output.split('\n'):
         if line.startswith('ipv4.method:'):
@@ -168,88 +201,99 @@ async def get_lan_status():
             addr = line.split(':', 1)[1].strip()
             if addr and addr != "--" and addr != "":
                 if '/' in addr:
-                    config["ip_address"] = addr.split('/')[0]
                     try:
-                        prefix = int(addr.split('/')[1])
-                        mask = (0xffffffff >> (32 - prefix)) << (32 - prefix)
-                        config["subnet_mask"] = f"{(mask >> 24) & 0xff}.{(mask >> 16) & 0xff}.{(mask >> 8) & 0xff}.{mask & 0xff}"
-                    except:
-                        pass
+                        iface = ipaddress.ip_interface(addr)
+                        config["ip_address"] = str(iface.ip)
+                        config["subnet_mask"] = str(iface.netmask)
+                    except ValueError:
+                        logger.warning(f"Unparseable ipv4.addresses value: {addr}")
         elif line.startswith('ipv4.gateway:'):
             gw = line.split(':', 1)[1].strip()
             if gw and gw != "--" and gw != "":
                 config["gateway"] = gw
 
     # Get actual current IP from interface
-    success2, ip_output = run_command(["ip", "-4", "addr", "show", "eth0"])
+    success2, ip_output = await run_command(["ip", "-4", "addr", "show", "eth0"])
     if success2:
-        for line in ip_output.split('\n'):
-            if 'inet ' in line:
-                parts = line.split()
-                if len(parts) >= 2:
-                    ip_with_prefix = parts[1]
-                    config["ip_address"] = ip_with_prefix.split('/')[0]
-                    config["connected"] = True
-                break
+        m = _INET_RE.search(ip_output)
+        if m:
+            config["ip_address"] = m.group(1)
+            config["connected"] = True
 
     return config
 
 
-@router.post("/lan/configure")
-async def configure_lan(request: LanConfigRequest):
-    """Configure LAN (eth0) - static IP or DHCP"""
-    logger.info(f"Configuring LAN: mode={request.mode}")
-
+async def _apply_lan_settings(request: LanConfigRequest, prefix: int):
+    """Apply LAN settings in the background - the nmcli down/up cycle
+    takes several seconds and must not hold an HTTP request open."""
     if request.mode == "static":
-        if not request.ip_address:
-            raise HTTPException(status_code=400, detail="IP address is required for static mode")
-
-        # Calculate prefix from subnet mask
-        prefix = 24  # default
-        if request.subnet_mask:
-            octets = request.subnet_mask.split('.')
-            binary = ''.join(format(int(o), '08b') for o in octets)
-            prefix = binary.count('1')
-
         # Set static IP
-        success, output = run_command([
+        success, output = await run_command([
             "sudo", "nmcli", "con", "mod", "Wired connection 1",
             "ipv4.addresses", f"{request.ip_address}/{prefix}",
             "ipv4.method", "manual"
         ])
 
         if not success:
-            raise HTTPException(status_code=500, detail=f"Failed to set IP: {output}")
+            logger.error(f"Failed to set IP: {output}")
+            return
 
         # Set gateway if provided
         if request.gateway:
-            run_command([
+            await run_command([
                 "sudo", "nmcli", "con", "mod", "Wired connection 1",
                 "ipv4.gateway", request.gateway
             ])
 
     else:  # DHCP
-        success, output = run_command([
+        success, output = await run_command([
             "sudo", "nmcli", "con", "mod", "Wired connection 1",
             "ipv4.method", "auto"
         ])
 
         if not success:
-            raise HTTPException(status_code=500, detail=f"Failed to set DHCP: {output}")
+            logger.error(f"Failed to set DHCP: {output}")
+            return
 
         # Clear static settings
-        run_command([
+        await run_command([
             "sudo", "nmcli", "con", "mod", "Wired connection 1",
             "ipv4.addresses", "",
             "ipv4.gateway", ""
         ])
 
     # Restart connection
-    run_command(["sudo", "nmcli", "con", "down", "Wired connection 1"])
-    success, output = run_command(["sudo", "nmcli", "con", "up", "Wired connection 1"])
+    await run_command(["sudo", "nmcli", "con", "down", "Wired connection 1"])
+    success, output = await run_command(["sudo", "nmcli", "con", "up", "Wired connection 1"])
 
     if not success:
-        raise HTTPException(status_code=500, detail=f"Failed to apply settings: {output}")
+        logger.error(f"Failed to apply LAN settings: {output}")
+        return
 
     logger.info(f"LAN configured successfully: {request.mode}")
-    return {"success": True, "message": f"LAN configured as {request.mode}"}
+
+
+@router.post("/lan/configure", status_code=202)
+async def configure_lan(background_tasks: BackgroundTasks,
+                        request: LanConfigRequest = Depends(raw_body(LanConfigRequest))):
+    """Configure LAN (eth0) - static IP or DHCP
+
+    Returns 202 immediately; the nmcli sequence runs in the background.
+    Clients poll /network/lan/status to observe the result.
+    """
+    logger.info(f"Configuring LAN: mode={request.mode}")
+
+    prefix = 24  # default
+    if request.mode == "static":
+        if not request.ip_address:
+            raise HTTPException(status_code=400, detail="IP address is required for static mode")
+
+        # Calculate prefix from subnet mask
+        if request.subnet_mask:
+            try:
+                prefix = ipaddress.IPv4Network(f"0.0.0.0/{request.subnet_mask}").prefixlen
+            except ValueError:
+                raise HTTPException(status_code=400, detail=f"Invalid subnet mask: {request.subnet_mask}")
+
+    background_tasks.add_task(_apply_lan_settings, request, prefix)
+    return {"success": True, "message": f"Applying {request.mode} configuration", "status": "pending"}
@@ -35,7 +35,9 @@ async def get_status():
     """Get all live data (force, position, status, indicators)"""
     if data_service is None:
         raise HTTPException(status_code=503, detail="Service not initialized")
-    return data_service.get_live_data()
+    # Snapshot taken on the PLC worker - the shared live payload is
+    # mutated in place there and must not be serialized from the loop
+    return await data_service.plc.run(data_service.get_live_data_copy)
 
 
 @router.get("/status/connection", response_model=ConnectionResponse)
@@ -2,16 +2,41 @@ import socketio
 import asyncio
 import logging
 from typing import Optional
+import orjson
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+
+class _OrjsonPackager:
+    """json module stand-in for Socket.IO using orjson's C encoder
+
+    The 10 Hz live_data broadcast re-serializes the telemetry dict on
+    every tick; orjson cuts that from a pure-Python encode to one C call.
+    """
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(data, *args, **kwargs):
+        return orjson.loads(data)
+
+
 # Create Socket.IO server
 sio = socketio.AsyncServer(
     async_mode='asgi',
     cors_allowed_origins='*',
+    json=_OrjsonPackager,
     logger=False,
-    engineio_logger=False
+    engineio_logger=False,
+    # WebSocket-only: skip the long-polling handshake and its per-message
+    # HTTP framing. The frontend connects with transports: ['websocket'].
+    # Wire compression for the 10 Hz telemetry comes from uvicorn's
+    # permessage-deflate support, not from engine.io (whose
+    # http_compression option only covers polling responses).
+    transports=['websocket']
 )
 
 # Services - will be set from main.py
@@ -22,6 +47,20 @@ plc_connector = None  # PLC connector for reconnection
 # Background task handle
 broadcast_task: Optional[asyncio.Task] = None
 
+# Set by command paths after a successful PLC write so the broadcaster
+# pushes fresh data immediately instead of waiting out the poll tick.
+data_changed = asyncio.Event()
+
+
+def notify_data_changed():
+    """Wake the broadcast loop for an immediate update"""
+    if data_service:
+        # Drop the memoized payload first - otherwise a wake-up inside the
+        # live-data TTL would re-serve the pre-write cache and the emit
+        # would be skipped as unchanged.
+        data_service.invalidate_live_cache()
+    data_changed.set()
+
 
 def set_services(data_svc, cmd_svc, plc=None):
     """Set service instances from main.py"""
@@ -31,95 +70,133 @@ def set_services(data_svc, cmd_svc, plc=None):
     plc_connector = plc
 
 
+# SIDs subscribed to live data - an O(1) emptiness check for the
+# broadcaster instead of digging through Socket.IO's room bookkeeping.
+LIVE_SUBS: set = set()
+
+# Hash of the last emitted payload - the broadcaster skips the emit when
+# it hasn't changed. Module-level so subscribe can reset it, forcing a
+# snapshot for clients that join while the payload is static.
+_last_payload_hash = 0
+
+
 @sio.event
 async def connect(sid, environ):
     """Handle client connection"""
     logger.info(f"Client connected: {sid}")
-    await sio.emit('connection_status', {'connected': True}, room=sid)
 
 
 @sio.event
 async def disconnect(sid):
     """Handle client disconnect - SAFETY: stop all jog on disconnect"""
     logger.info(f"Client disconnected: {sid}")
+    LIVE_SUBS.discard(sid)
     if command_service:
-        # Safety: stop all jog movements when client disconnects
-        command_service.stop_all_jog()
-        logger.warning(f"Safety stop executed for disconnected client: {sid}")
+        # Safety: stop all jog movements when client disconnects.
+        # Fire-and-forget - nobody is listening for the result and the
+        # worker queue preserves ordering with in-flight commands.
+        command_service.plc.submit(command_service.stop_all_jog)
+        logger.warning(f"Safety stop queued for disconnected client: {sid}")
 
 
 @sio.event
 async def subscribe(sid, data):
     """Subscribe to live data updates"""
+    global _last_payload_hash
+    LIVE_SUBS.add(sid)
     await sio.enter_room(sid, 'live_data')
+    # Force the next tick to emit even if the payload hasn't changed -
+    # a fresh dashboard needs its initial snapshot.
+    _last_payload_hash = 0
+    notify_data_changed()
+    await sio.emit('connection_status',
+                   {'connected': bool(plc_connector and plc_connector.connected)},
+                   room=sid)
     logger.info(f"Client {sid} subscribed to live_data")
 
 
 @sio.event
 async def unsubscribe(sid, data):
     """Unsubscribe from live data updates"""
+    LIVE_SUBS.discard(sid)
     await sio.leave_room(sid, 'live_data')
     logger.info(f"Client {sid} unsubscribed from live_data")
 
 
+async def _handle_jog(sid, direction, command, data):
+    """Execute a jog command and send a single combined ack
+
+    One emit per command instead of separate jog_rejected + jog_response
+    events - each extra emit re-serializes and pushes its own engine.io
+    frame. Rejection details ride along in the ack.
+    """
+    state = data.get('state', False)
+    result = await command_service.plc.run(command, state)
+
+    ack = {
+        'direction': direction,
+        'state': state,
+        'success': result.get('success', False)
+    }
+    if not result.get('success') and result.get('reason') == 'LOCAL_MODE':
+        ack['rejected'] = {
+            'reason': result.get('reason'),
+            'message': result.get('message')
+        }
+    else:
+        notify_data_changed()
+    await sio.emit('jog_response', ack, room=sid)
+
+
 @sio.event
 async def jog_forward(sid, data):
     """Handle jog forward command from client"""
     if command_service:
-        state = data.get('state', False)
-        result = command_service.jog_forward(state)
-
-        # Check if jog was rejected due to LOCAL mode
-        if not result.get('success') and result.get('reason') == 'LOCAL_MODE':
-            await sio.emit('jog_rejected', {
-                'direction': 'forward',
-                'reason': result.get('reason'),
-                'message': result.get('message')
-            }, room=sid)
-
-        await sio.emit('jog_response', {
-            'direction': 'forward',
-            'state': state,
-            'success': result.get('success', False)
-        }, room=sid)
+        await _handle_jog(sid, 'forward', command_service.jog_forward, data)
 
 
 @sio.event
 async def jog_backward(sid, data):
     """Handle jog backward command from client"""
     if command_service:
-        state = data.get('state', False)
-        result = command_service.jog_backward(state)
-
-        # Check if jog was rejected due to LOCAL mode
-        if not result.get('success') and result.get('reason') == 'LOCAL_MODE':
-            await sio.emit('jog_rejected', {
-                'direction': 'backward',
-                'reason': result.get('reason'),
-                'message': result.get('message')
-            }, room=sid)
-
-        await sio.emit('jog_response', {
-            'direction': 'backward',
-            'state': state,
-            'success': result.get('success', False)
+        await _handle_jog(sid, 'backward', command_service.jog_backward, data)
+
+
+# Debounce for slider-driven speed updates - only the last value in a
+# 50 ms burst is forwarded to the PLC.
+JOG_SPEED_DEBOUNCE = 0.05  # seconds
+_pending_speed: dict = {}
+
+
+async def _apply_jog_speed(sid, velocity):
+    try:
+        await asyncio.sleep(JOG_SPEED_DEBOUNCE)
+        success = await command_service.plc.run(command_service.set_jog_velocity, velocity)
+        if success:
+            notify_data_changed()
+        await sio.emit('jog_speed_response', {
+            'velocity': velocity,
+            'success': success
         }, room=sid)
+    finally:
+        if _pending_speed.get(sid) is asyncio.current_task():
+            del _pending_speed[sid]
 
 
 @sio.event
 async def set_jog_speed(sid, data):
-    """Set jog velocity"""
+    """Set jog velocity (debounced)"""
     if command_service:
         velocity = data.get('velocity', 50)
-        success = command_service.set_jog_velocity(velocity)
-        await sio.emit('jog_speed_response', {
-            'velocity': velocity,
-            'success': success
-        }, room=sid)
+        pending = _pending_speed.get(sid)
+        if pending:
+            pending.cancel()
+        _pending_speed[sid] = asyncio.create_task(_apply_jog_speed(sid, velocity))
 
 
 async def broadcast_live_data():
     """Background task to broadcast live data every 100ms"""
+    global _last_payload_hash
     logger.info("Starting live data broadcast task")
     reconnect_interval = 0  # Counter for reconnection attempts
     last_connected = False
@@ -132,7 +209,8 @@ async def broadcast_live_data():
                 if reconnect_interval >= 50:  # 50 * 100ms = 5 seconds
                     reconnect_interval = 0
                     logger.info("Attempting to reconnect to PLC...")
-                    if plc_connector.connect():
+                    # TCP handshake can block for seconds - keep it off the loop
+                    if await asyncio.to_thread(plc_connector.connect):
                         logger.info("Reconnected to PLC successfully!")
                         await emit_connection_status(True)
                         last_connected = True
@@ -146,13 +224,28 @@ async def broadcast_live_data():
                     last_connected = True
                     await emit_connection_status(True)
 
-            if data_service:
-                data = data_service.get_live_data()
-                await sio.emit('live_data', data, room='live_data')
+            # Only read and emit when someone is actually listening, and
+            # skip the emit entirely when the payload hasn't changed
+            # (common while the PLC is idle).
+            if data_service and LIVE_SUBS:
+                # Read on the connector's worker thread so the poll queues
+                # behind in-flight commands instead of contending for the
+                # snap7 lock from a throwaway thread.
+                data = await plc_connector.run(data_service.get_live_data)
+                payload_hash = hash(orjson.dumps(data))
+                if payload_hash != _last_payload_hash:
+                    _last_payload_hash = payload_hash
+                    await sio.emit('live_data', data, room='live_data')
         except Exception as e:
             logger.error(f"Error broadcasting live data: {e}")
 
-        await asyncio.sleep(settings.WS_UPDATE_INTERVAL)
+        # Poll-interval timeout keeps the reconnect logic ticking; a
+        # data_changed signal wakes the loop early for a low-jitter push.
+        try:
+            await asyncio.wait_for(data_changed.wait(), timeout=settings.WS_UPDATE_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        data_changed.clear()
 
 
 async def emit_test_complete(test_data: dict):
@@ -1,9 +1,41 @@
+import struct
+import threading
 import time
 import logging
+from functools import partial
+from typing import Final
 from .connector import PLCConnector
 
 logger = logging.getLogger(__name__)
 
+# DB numbers as module-level constants - the hot methods load these as
+# globals instead of walking the class attribute chain on every call
+_DB_RESULTS: Final = 2   # DB2 - Test Results
+_DB_SERVO: Final = 3     # DB3 - Servo Control
+_DB_HMI: Final = 4       # DB4 - HMI Interface
+
+# Precomputed single-bit masks for the DB3 status byte decodes - the hot
+# check/decode paths test these directly instead of shifting per call
+_MASK_REMOTE_MODE = 1 << 0      # DB3.DBX25.0
+_MASK_ESTOP = 1 << 1            # DB3.DBX25.1
+_MASK_UPPER_LIMIT = 1 << 2      # DB3.DBX25.2
+_MASK_LOWER_LIMIT = 1 << 3      # DB3.DBX25.3
+_MASK_HOME_POS = 1 << 4         # DB3.DBX25.4
+_MASK_SAFETY_OK = 1 << 5        # DB3.DBX25.5
+_MASK_MOTION_OK = 1 << 6        # DB3.DBX25.6
+_MASK_MODE_CHANGE_OK = 1 << 0   # DB3.DBX30.0
+_MASK_STEP_ACTIVE = 1 << 2      # DB3.DBX36.2
+_MASK_STEP_DONE = 1 << 3        # DB3.DBX36.3
+
+# DB3 byte 0 jog bits and the bit patterns each jog transition writes -
+# built once so the per-tick path passes a ready dict to write_bits
+_MASK_JOG_FORWARD = 1 << 1      # DB3.DBX0.1
+_MASK_JOG_BACKWARD = 1 << 2     # DB3.DBX0.2
+_JOG_FWD_ON = {1: True, 2: False}
+_JOG_FWD_OFF = {1: False}
+_JOG_BWD_ON = {1: False, 2: True}
+_JOG_BWD_OFF = {2: False}
+
 
 class CommandService:
     """Service for sending commands to PLC
@@ -14,6 +46,11 @@ class CommandService:
     - DB4: HMI commands
     """
 
+    # No per-instance __dict__: attribute loads in the per-tick jog/step
+    # methods take the slot fast path
+    __slots__ = ("plc", "_status_bytes", "_status_ts", "_jog_bits",
+                 "_write_jog_velocity", "_write_jog_stop")
+
     DB_RESULTS = 2   # DB2 - Test Results
     DB_SERVO = 3     # DB3 - Servo Control
     DB_HMI = 4       # DB4 - HMI Interface
@@ -78,31 +115,108 @@ class CommandService:
     HMI_TARE_LOADCELL = (59, 6)    # DB4.DBX59.6 - Tare command
     HMI_TARE_POSITION = (59, 7)    # DB4.DBX59.7 - Zero position
 
+    # Status reads within one user action reuse a single read of DB3
+    # bytes 25..36 for this long (seconds)
+    STATUS_CACHE_TTL = 0.05
+
     def __init__(self, plc: PLCConnector):
         self.plc = plc
+        self._status_bytes = None
+        self._status_ts = 0.0
+        # Last jog bit pattern we successfully wrote to DB3 byte 0, or
+        # None when unknown (startup, after a failed write or disconnect)
+        self._jog_bits = None
+        # Pre-bound writers for the per-tick jog paths - the (db, byte, bit)
+        # arguments are marshalled once here instead of on every call
+        self._write_jog_velocity = partial(plc.write_real, _DB_SERVO, self.CMD_JOG_VELOCITY_SETPOINT)
+        self._write_jog_stop = partial(plc.write_bits, _DB_SERVO, 0, {
+            self.CMD_JOG_FORWARD[1]: False,
+            self.CMD_JOG_BACKWARD[1]: False,
+        })
 
     def _check_connection(self) -> bool:
         """Check PLC connection before command"""
         if not self.plc.connected:
+            # Jog bits may change under us while disconnected
+            self._jog_bits = None
             logger.warning("Cannot execute command: PLC not connected")
             return False
         return True
 
+    def _write_jog(self, bits: dict, mirror) -> bool:
+        """Apply a jog bit pattern in one RMW and track the intended state
+
+        `mirror` is the byte-0 jog pattern the write leaves behind. A
+        failed write drops the mirror so the next call goes to the wire.
+        """
+        result = self.plc.write_bits(_DB_SERVO, 0, bits)
+        self._jog_bits = mirror if result else None
+        return result
+
+    def _read_status_bytes(self):
+        """Read DB3 bytes 25..36 once and serve all status decodes from cache
+
+        One db_read covers the mode/safety bits (25), the mode-change bit
+        (30), the step distance REAL (32..35) and the step bits (36), so a
+        status poll that previously cost up to nine round-trips costs one.
+        The short TTL keeps checks within the same command on the same
+        snapshot; writes into the range invalidate it.
+        """
+        now = time.monotonic()
+        if self._status_bytes is not None and now - self._status_ts < self.STATUS_CACHE_TTL:
+            return self._status_bytes
+        data = self.plc.read_bytes(_DB_SERVO, 25, 12)
+        if data is not None:
+            self._status_bytes = data
+            self._status_ts = now
+        return data
+
+    def _invalidate_status_cache(self):
+        """Drop the cached status bytes after a write that changes them"""
+        self._status_bytes = None
+
+    def _pulse(self, db: int, byte_offset: int, bit_offset: int, hold: float) -> bool:
+        """Write a rising edge now and clear the bit after `hold` seconds
+
+        The falling edge runs on a timer thread instead of a blocking
+        time.sleep, so the command returns as soon as the rising edge is
+        on the wire (the connector lock serializes the delayed write).
+        """
+        result = self.plc.write_bool(db, byte_offset, bit_offset, True)
+        if result:
+            timer = threading.Timer(
+                hold, self.plc.write_bool, args=(db, byte_offset, bit_offset, False)
+            )
+            timer.daemon = True
+            timer.start()
+        return result
+
+    def _status_bit(self, index: int, mask: int) -> bool:
+        """Decode one status bit from the cached DB3 byte range
+
+        `index` is the byte position within the cached range (byte 25 is 0),
+        `mask` one of the precomputed module-level bit masks.
+        """
+        data = self._read_status_bytes()
+        if data is None:
+            return False
+        return bool(data[index] & mask)
+
     def _check_remote_mode(self) -> bool:
         """Check if system is in REMOTE mode"""
-        return self.plc.read_bool(self.DB_SERVO, *self.CMD_REMOTE_MODE) or False
+        return self._status_bit(0, _MASK_REMOTE_MODE)
 
     def _check_mode_change_allowed(self) -> bool:
         """Check if mode change is allowed"""
-        return self.plc.read_bool(self.DB_SERVO, *self.STATUS_MODE_CHANGE_OK) or False
+        return self._status_bit(5, _MASK_MODE_CHANGE_OK)
 
     def _check_safety_ok(self) -> bool:
         """Check if safety is OK"""
-        return self.plc.read_bool(self.DB_SERVO, *self.STATUS_SAFETY_OK) or False
+        return self._status_bit(0, _MASK_SAFETY_OK)
 
     def _check_motion_allowed(self) -> bool:
         """Check if motion is allowed"""
-        return self.plc.read_bool(self.DB_SERVO, *self.STATUS_MOTION_OK) or False
+        return self._status_bit(0, _MASK_MOTION_OK)
 
     # ========== TARE / ZERO Commands ==========
 
@@ -113,13 +227,11 @@ class CommandService:
         
         try:
             # Send tare pulse to DB2
-            self.plc.write_bool(self.DB_RESULTS, *self.CMD_TARE_LOADCELL, True)
-            time.sleep(0.1)
-            self.plc.write_bool(self.DB_RESULTS, *self.CMD_TARE_LOADCELL, False)
+            self._pulse(_DB_RESULTS, *self.CMD_TARE_LOADCELL, 0.1)
             logger.info("Load cell tare command sent (DB2.DBX60.0)")
             return {"success": True, "message": "Tare command sent"}
         except Exception as e:
-            logger.error(f"Tare error: {e}")
+            logger.error("Tare error: %s", e)
             return {"success": False, "message": str(e)}
 
     def zero_position(self) -> dict:
@@ -129,13 +241,11 @@ class CommandService:
         
         try:
             # Send zero position pulse to DB4
-            self.plc.write_bool(self.DB_HMI, *self.HMI_TARE_POSITION, True)
-            time.sleep(0.1)
-            self.plc.write_bool(self.DB_HMI, *self.HMI_TARE_POSITION, False)
+            self._pulse(_DB_HMI, *self.HMI_TARE_POSITION, 0.1)
             logger.info("Position zero command sent (DB4.DBX59.7)")
             return {"success": True, "message": "Position zeroed"}
         except Exception as e:
-            logger.error(f"Zero position error: {e}")
+            logger.error("Zero position error: %s", e)
             return {"success": False, "message": str(e)}
 
     # ========== Servo Control ==========
@@ -144,7 +254,7 @@ class CommandService:
         """Enable servo motor - DB3.DBX0.0"""
         if not self._check_connection():
             return False
-        result = self.plc.write_bool(self.DB_SERVO, *self.CMD_ENABLE, True)
+        result = self.plc.write_bool(_DB_SERVO, *self.CMD_ENABLE, True)
         logger.info("Servo enabled (DB3.DBX0.0 = True)")
         return result
 
@@ -152,8 +262,14 @@ class CommandService:
         """Disable servo motor - DB3.DBX0.0"""
         if not self._check_connection():
             return False
-        self.stop_all_jog()
-        result = self.plc.write_bool(self.DB_SERVO, *self.CMD_ENABLE, False)
+        # One RMW drops enable and both jog bits together instead of three
+        # writes with a short-circuit between them
+        result = self.plc.write_bits(_DB_SERVO, 0, {
+            self.CMD_ENABLE[1]: False,
+            self.CMD_JOG_FORWARD[1]: False,
+            self.CMD_JOG_BACKWARD[1]: False,
+        })
+        self._jog_bits = 0 if result else None
         logger.info("Servo disabled (DB3.DBX0.0 = False)")
         return result
 
@@ -161,9 +277,7 @@ class CommandService:
         """Reset servo alarm - DB3.DBX0.5 (pulse)"""
         if not self._check_connection():
             return False
-        self.plc.write_bool(self.DB_SERVO, *self.CMD_RESET, True)
-        time.sleep(0.5)
-        result = self.plc.write_bool(self.DB_SERVO, *self.CMD_RESET, False)
+        result = self._pulse(_DB_SERVO, *self.CMD_RESET, 0.5)
         logger.info("Alarm reset (DB3.DBX0.5 pulse)")
         return result
 
@@ -181,9 +295,19 @@ class CommandService:
             return {"success": False, "reason": "MOTION_BLOCKED", "message": "Motion not allowed - Check safety"}
 
         if state:
-            self.plc.write_bool(self.DB_SERVO, *self.CMD_JOG_BACKWARD, False)
-        result = self.plc.write_bool(self.DB_SERVO, *self.CMD_JOG_FORWARD, state)
-        logger.info(f"Jog forward: {state} (DB3.DBX0.1)")
+            if self._jog_bits == _MASK_JOG_FORWARD:
+                # Mirror says forward is already the only jog bit set -
+                # skip the redundant round-trip
+                result = True
+            else:
+                result = self._write_jog(_JOG_FWD_ON, _MASK_JOG_FORWARD)
+        else:
+            # Stops always go to the wire, whatever the mirror says
+            prev = self._jog_bits
+            result = self._write_jog(
+                _JOG_FWD_OFF, prev & ~_MASK_JOG_FORWARD if prev is not None else None)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Jog forward: %s (DB3.DBX0.1)", state)
         return {"success": result}
 
     def jog_backward(self, state: bool) -> dict:
@@ -198,27 +322,41 @@ class CommandService:
             return {"success": False, "reason": "MOTION_BLOCKED", "message": "Motion not allowed - Check safety"}
 
         if state:
-            self.plc.write_bool(self.DB_SERVO, *self.CMD_JOG_FORWARD, False)
-        result = self.plc.write_bool(self.DB_SERVO, *self.CMD_JOG_BACKWARD, state)
-        logger.info(f"Jog backward: {state} (DB3.DBX0.2)")
+            if self._jog_bits == _MASK_JOG_BACKWARD:
+                # Mirror says backward is already the only jog bit set -
+                # skip the redundant round-trip
+                result = True
+            else:
+                result = self._write_jog(_JOG_BWD_ON, _MASK_JOG_BACKWARD)
+        else:
+            # Stops always go to the wire, whatever the mirror says
+            prev = self._jog_bits
+            result = self._write_jog(
+                _JOG_BWD_OFF, prev & ~_MASK_JOG_BACKWARD if prev is not None else None)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Jog backward: %s (DB3.DBX0.2)", state)
         return {"success": result}
 
     def set_jog_velocity(self, velocity: float) -> bool:
         """Set jog speed - DB3.DBD16 (mm/min)"""
         if not self._check_connection():
             return False
-        velocity = max(1.2, min(6000.0, velocity))
-        result = self.plc.write_real(self.DB_SERVO, self.CMD_JOG_VELOCITY_SETPOINT, velocity)
-        logger.info(f"Jog velocity: {velocity} mm/min (DB3.DBD16)")
+        # Inline clamp - no max/min call chain on the slider-drag path
+        velocity = 1.2 if velocity < 1.2 else 6000.0 if velocity > 6000.0 else velocity
+        result = self._write_jog_velocity(velocity)
+        if result:
+            self._invalidate_status_cache()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Jog velocity: %s mm/min (DB3.DBD16)", velocity)
         return result
 
     def stop_all_jog(self) -> bool:
         """Stop all jog movements"""
         if not self._check_connection():
             return False
-        success = True
-        success &= self.plc.write_bool(self.DB_SERVO, *self.CMD_JOG_FORWARD, False)
-        success &= self.plc.write_bool(self.DB_SERVO, *self.CMD_JOG_BACKWARD, False)
+        # Both jog bits live in DB3 byte 0 - clear them in one round-trip
+        success = self._write_jog_stop()
+        self._jog_bits = 0 if success else None
         logger.info("All jog stopped")
         return success
 
@@ -228,7 +366,7 @@ class CommandService:
         """Lock upper clamp - DB3.DBX14.0"""
         if not self._check_connection():
             return False
-        result = self.plc.write_bool(self.DB_SERVO, *self.CMD_LOCK_UPPER, True)
+        result = self.plc.write_bool(_DB_SERVO, *self.CMD_LOCK_UPPER, True)
         logger.info("Upper clamp locked (DB3.DBX14.0 = True)")
         return result
 
@@ -236,7 +374,7 @@ class CommandService:
         """Lock lower clamp - DB3.DBX14.1"""
         if not self._check_connection():
             return False
-        result = self.plc.write_bool(self.DB_SERVO, *self.CMD_LOCK_LOWER, True)
+        result = self.plc.write_bool(_DB_SERVO, *self.CMD_LOCK_LOWER, True)
         logger.info("Lower clamp locked (DB3.DBX14.1 = True)")
         return result
 
@@ -244,7 +382,7 @@ class CommandService:
         """Unlock upper clamp - DB3.DBX14.0"""
         if not self._check_connection():
             return False
-        result = self.plc.write_bool(self.DB_SERVO, *self.CMD_LOCK_UPPER, False)
+        result = self.plc.write_bool(_DB_SERVO, *self.CMD_LOCK_UPPER, False)
         logger.info("Upper clamp unlocked (DB3.DBX14.0 = False)")
         return result
 
@@ -252,13 +390,19 @@ class CommandService:
         """Unlock lower clamp - DB3.DBX14.1"""
         if not self._check_connection():
             return False
-        result = self.plc.write_bool(self.DB_SERVO, *self.CMD_LOCK_LOWER, False)
+        result = self.plc.write_bool(_DB_SERVO, *self.CMD_LOCK_LOWER, False)
         logger.info("Lower clamp unlocked (DB3.DBX14.1 = False)")
         return result
 
     def unlock_all(self) -> bool:
         """Unlock all clamps"""
-        success = self.unlock_upper() and self.unlock_lower()
+        if not self._check_connection():
+            return False
+        # Both lock bits live in DB3 byte 14 - clear them in one round-trip
+        success = self.plc.write_bits(_DB_SERVO, 14, {
+            self.CMD_LOCK_UPPER[1]: False,
+            self.CMD_LOCK_LOWER[1]: False,
+        })
         logger.info("All clamps unlocked")
         return success
 
@@ -275,7 +419,7 @@ class CommandService:
         if not self._check_safety_ok():
             return {"success": False, "message": "Cannot start - Safety not OK"}
         
-        result = self.plc.write_bool(self.DB_SERVO, *self.CMD_START_TEST, True)
+        result = self.plc.write_bool(_DB_SERVO, *self.CMD_START_TEST, True)
         logger.info("Test started (DB3.DBX0.3 = True)")
         return {"success": result, "message": "Test started" if result else "Failed to start"}
 
@@ -283,10 +427,21 @@ class CommandService:
         """Emergency stop - DB3.DBX0.4"""
         if not self._check_connection():
             return False
-        self.stop_all_jog()
-        self.plc.write_bool(self.DB_SERVO, *self.CMD_STOP, True)
-        time.sleep(0.1)
-        result = self.plc.write_bool(self.DB_SERVO, *self.CMD_STOP, False)
+        # One RMW clears both jog bits and raises STOP together - atomic on
+        # the PLC side, no window with jog still set, and no early exit
+        # between the writes
+        result = self.plc.write_bits(_DB_SERVO, 0, {
+            self.CMD_JOG_FORWARD[1]: False,
+            self.CMD_JOG_BACKWARD[1]: False,
+            self.CMD_STOP[1]: True,
+        })
+        self._jog_bits = 0 if result else None
+        if result:
+            timer = threading.Timer(
+                0.1, self.plc.write_bool, args=(_DB_SERVO, *self.CMD_STOP, False)
+            )
+            timer.daemon = True
+            timer.start()
         logger.warning("STOP executed (DB3.DBX0.4)")
         return result
 
@@ -298,7 +453,7 @@ class CommandService:
         if not self._check_remote_mode():
             return {"success": False, "message": "Cannot home - System in LOCAL mode"}
         
-        result = self.plc.write_bool(self.DB_SERVO, *self.CMD_HOME, True)
+        result = self.plc.write_bool(_DB_SERVO, *self.CMD_HOME, True)
         logger.info("Homing started (DB3.DBX0.6 = True)")
         return {"success": result, "message": "Homing started" if result else "Failed to start homing"}
 
@@ -313,36 +468,153 @@ class CommandService:
         if not self._check_mode_change_allowed():
             return {"success": False, "message": "Mode change not allowed - Test may be running"}
         
-        result = self.plc.write_bool(self.DB_SERVO, *self.CMD_REMOTE_MODE, is_remote)
+        result = self.plc.write_bool(_DB_SERVO, *self.CMD_REMOTE_MODE, is_remote)
+        if result:
+            self._invalidate_status_cache()
         mode = "Remote" if is_remote else "Local"
-        logger.info(f"Mode: {mode} (DB3.DBX25.0 = {is_remote})")
+        logger.info("Mode: %s (DB3.DBX25.0 = %s)", mode, is_remote)
         return {"success": result, "message": f"Switched to {mode} mode"}
 
     def get_remote_mode(self) -> bool:
         """Get remote mode - DB3.DBX25.0"""
         if not self.plc.connected:
             return False
-        return self.plc.read_bool(self.DB_SERVO, *self.CMD_REMOTE_MODE) or False
+        return self._status_bit(0, _MASK_REMOTE_MODE)
 
     # ========== Safety Status (Read Only) ==========
 
     def get_safety_status(self) -> dict:
         """Read all safety status bits"""
-        if not self.plc.connected:
+        data = self._read_status_bytes() if self.plc.connected else None
+        if data is None:
             return {
                 "e_stop": False, "upper_limit": False, "lower_limit": False,
                 "home": False, "safety_ok": False, "motion_allowed": False
             }
-        
+
+        # All six bits live in DB3 byte 25 - decode the single cached read
+        # instead of six read_bool round-trips
+        b = data[0]
         return {
-            "e_stop": self.plc.read_bool(self.DB_SERVO, *self.STATUS_ESTOP) or False,
-            "upper_limit": self.plc.read_bool(self.DB_SERVO, *self.STATUS_UPPER_LIMIT) or False,
-            "lower_limit": self.plc.read_bool(self.DB_SERVO, *self.STATUS_LOWER_LIMIT) or False,
-            "home": self.plc.read_bool(self.DB_SERVO, *self.STATUS_HOME_POS) or False,
-            "safety_ok": self.plc.read_bool(self.DB_SERVO, *self.STATUS_SAFETY_OK) or False,
-            "motion_allowed": self.plc.read_bool(self.DB_SERVO, *self.STATUS_MOTION_OK) or False,
+            "e_stop": bool(b & _MASK_ESTOP),
+            "upper_limit": bool(b & _MASK_UPPER_LIMIT),
+            "lower_limit": bool(b & _MASK_LOWER_LIMIT),
+            "home": bool(b & _MASK_HOME_POS),
+            "safety_ok": bool(b & _MASK_SAFETY_OK),
+            "motion_allowed": bool(b & _MASK_MOTION_OK),
         }
 
+    # ========== Batched sequences ==========
+
+    def execute_sequence(self, commands: list) -> list:
+        """Execute several writes in as few PLC round-trips as possible
+
+        `commands` is a list of tuples:
+            ("write_bool", db, byte_offset, bit_offset, value)
+            ("write_real", db, offset, value)
+
+        Writes are grouped by DB and coalesced into contiguous byte spans,
+        each applied with one read-modify-write - so a test-prep sequence
+        like enable + lock clamps + set velocity costs a couple of
+        round-trips instead of one per command. Returns one bool per
+        command, in input order (commands sharing a span share its result).
+        """
+        # (db, start, length, edit) per command
+        edits = []
+        for op in commands:
+            kind = op[0]
+            if kind == "write_bool":
+                _, db, byte_offset, bit_offset, value = op
+                edits.append((db, byte_offset, 1, ("bit", bit_offset, value)))
+            elif kind == "write_real":
+                _, db, offset, value = op
+                edits.append((db, offset, 4, ("real", value)))
+            else:
+                raise ValueError(f"Unknown sequence op: {kind}")
+
+        results = [False] * len(commands)
+        if not self._check_connection():
+            return results
+
+        by_db = {}
+        for i, (db, _start, _length, _edit) in enumerate(edits):
+            by_db.setdefault(db, []).append(i)
+
+        for db, indices in by_db.items():
+            # Coalesce adjacent/overlapping byte ranges into spans
+            spans = []  # (start, end, member indices)
+            for i in sorted(indices, key=lambda i: edits[i][1]):
+                start, length = edits[i][1], edits[i][2]
+                if spans and start <= spans[-1][1]:
+                    spans[-1] = (spans[-1][0], max(spans[-1][1], start + length),
+                                 spans[-1][2] + [i])
+                else:
+                    spans.append((start, start + length, [i]))
+
+            for start, end, members in spans:
+                # Read-modify-write so bits outside the commands survive
+                buf = self.plc.read_bytes(db, start, end - start)
+                if buf is None:
+                    continue
+                for i in members:
+                    offset = edits[i][1] - start
+                    edit = edits[i][3]
+                    if edit[0] == "bit":
+                        _, bit, value = edit
+                        if value:
+                            buf[offset] |= 1 << bit
+                        else:
+                            buf[offset] &= ~(1 << bit)
+                    else:
+                        struct.pack_into('>f', buf, offset, edit[1])
+                ok = self.plc.write_bytes(db, start, buf)
+                for i in members:
+                    results[i] = ok
+
+        if _DB_SERVO in by_db:
+            self._invalidate_status_cache()
+        return results
+
+    def set_motion_params(self, velocity: float = None, step_distance: float = None) -> dict:
+        """Set jog velocity (DBD26) and step distance (DBD32) in one write
+
+        The two REALs sit at bytes 26..29 and 32..35 with only the
+        mode-change word between them, so a combined update fits a single
+        db_write of bytes 26..35; the gap bytes 30..31 are read first and
+        preserved. With only one value given this falls back to the plain
+        4-byte setter.
+        """
+        if velocity is None or step_distance is None:
+            if velocity is not None:
+                return {"success": self.set_jog_velocity(velocity), "velocity": velocity}
+            if step_distance is not None:
+                return self.set_step_distance(step_distance)
+            return {"success": False, "message": "No parameters given"}
+
+        if not self._check_connection():
+            return {"success": False, "message": "PLC not connected"}
+
+        velocity = 1.2 if velocity < 1.2 else 6000.0 if velocity > 6000.0 else velocity
+        step_distance = -step_distance if step_distance < 0 else step_distance
+        if not 0.1 <= step_distance <= 100:
+            return {"success": False, "message": "Distance must be between 0.1 and 100 mm"}
+
+        gap = self.plc.read_bytes(_DB_SERVO, 30, 2)
+        if gap is None:
+            return {"success": False, "message": "PLC read failed"}
+
+        buf = bytearray(10)
+        struct.pack_into('>f', buf, 0, velocity)
+        buf[4:6] = gap
+        struct.pack_into('>f', buf, 6, step_distance)
+        result = self.plc.write_bytes(_DB_SERVO, self.CMD_JOG_VELOCITY_SETPOINT, buf)
+        if result:
+            self._invalidate_status_cache()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Motion params: velocity=%s mm/min, step=%s mm (DB3.DBD26+DBD32)",
+                        velocity, step_distance)
+        return {"success": result, "velocity": velocity, "distance": step_distance}
+
     # ═══════════════════════════════════════════════════════════════════
     # STEP MOVEMENT CONTROL
     # ═══════════════════════════════════════════════════════════════════
@@ -360,13 +632,15 @@ class CommandService:
         if not self._check_connection():
             return {"success": False, "message": "PLC not connected"}
         
-        # Validate distance (0.1 - 100 mm)
-        distance = abs(distance)
-        if distance < 0.1 or distance > 100:
+        # Validate distance (0.1 - 100 mm) - inline sign fold, chained compare
+        distance = -distance if distance < 0 else distance
+        if not 0.1 <= distance <= 100:
             return {"success": False, "message": "Distance must be between 0.1 and 100 mm"}
         
-        result = self.plc.write_real(self.DB_SERVO, self.STEP_DISTANCE, distance)
-        logger.info(f"Step distance set to {distance} mm (DB3.DBD32)")
+        result = self.plc.write_real(_DB_SERVO, self.STEP_DISTANCE, distance)
+        if result:
+            self._invalidate_status_cache()
+        logger.info("Step distance set to %s mm (DB3.DBD32)", distance)
         return {"success": result, "distance": distance}
 
     def step_forward(self) -> dict:
@@ -375,7 +649,7 @@ class CommandService:
             return {"success": False, "error": "PLC not connected"}
         
         # Check if step already in progress
-        if self.plc.read_bool(self.DB_SERVO, self.STEP_COMMANDS, self.BIT_STEP_ACTIVE):
+        if self.plc.read_bool(_DB_SERVO, self.STEP_COMMANDS, self.BIT_STEP_ACTIVE):
             return {"success": False, "error": "Step already in progress"}
         
         # Check remote mode
@@ -387,7 +661,9 @@ class CommandService:
             return {"success": False, "error": "Safety not OK"}
         
         # Send step forward command (one-shot)
-        result = self.plc.write_bool(self.DB_SERVO, self.STEP_COMMANDS, self.BIT_STEP_FORWARD, True)
+        result = self.plc.write_bool(_DB_SERVO, self.STEP_COMMANDS, self.BIT_STEP_FORWARD, True)
+        if result:
+            self._invalidate_status_cache()
         logger.info("Step forward command sent (DB3.DBX36.0)")
         return {"success": result, "direction": "forward"}
 
@@ -397,7 +673,7 @@ class CommandService:
             return {"success": False, "error": "PLC not connected"}
         
         # Check if step already in progress
-        if self.plc.read_bool(self.DB_SERVO, self.STEP_COMMANDS, self.BIT_STEP_ACTIVE):
+        if self.plc.read_bool(_DB_SERVO, self.STEP_COMMANDS, self.BIT_STEP_ACTIVE):
             return {"success": False, "error": "Step already in progress"}
         
         # Check remote mode
@@ -409,17 +685,23 @@ class CommandService:
             return {"success": False, "error": "Safety not OK"}
         
         # Send step backward command (one-shot)
-        result = self.plc.write_bool(self.DB_SERVO, self.STEP_COMMANDS, self.BIT_STEP_BACKWARD, True)
+        result = self.plc.write_bool(_DB_SERVO, self.STEP_COMMANDS, self.BIT_STEP_BACKWARD, True)
+        if result:
+            self._invalidate_status_cache()
         logger.info("Step backward command sent (DB3.DBX36.1)")
         return {"success": result, "direction": "backward"}
 
     def get_step_status(self) -> dict:
         """Get current step movement status"""
-        if not self.plc.connected:
+        # Distance (DBD32) and the step bits (DBB36) both sit in the cached
+        # DB3 status snapshot - no extra round-trip on top of a status poll
+        data = self._read_status_bytes() if self.plc.connected else None
+        if data is None:
             return {"distance": 0.0, "active": False, "done": False}
-        
+
+        bits = data[11]
         return {
-            "distance": self.plc.read_real(self.DB_SERVO, self.STEP_DISTANCE) or 0.0,
-            "active": self.plc.read_bool(self.DB_SERVO, self.STEP_COMMANDS, self.BIT_STEP_ACTIVE) or False,
-            "done": self.plc.read_bool(self.DB_SERVO, self.STEP_COMMANDS, self.BIT_STEP_DONE) or False,
+            "distance": struct.unpack_from('>f', data, 7)[0],
+            "active": bool(bits & _MASK_STEP_ACTIVE),
+            "done": bool(bits & _MASK_STEP_DONE),
         }
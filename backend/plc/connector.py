@@ -1,13 +1,21 @@
 import snap7
 from snap7.client import Area as Areas
-from snap7.util import get_real, set_real, get_int, get_bool, set_bool
+from snap7.util import get_bool, set_bool
+import asyncio
+import struct
 import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Precompiled big-endian codecs for S7 REAL and INT - the format string is
+# parsed once here instead of on every read/write
+_REAL = struct.Struct('>f')
+_INT = struct.Struct('>h')
+
 
 class PLCConnector:
     """Snap7 PLC Connection Handler for Siemens S7-1214C"""
@@ -29,6 +37,25 @@ class PLCConnector:
         self.client = snap7.client.Client()
         self._connected = False
         self.lock = threading.Lock()
+        # Reused REAL write buffer - only touched under the lock
+        self._real_buf = bytearray(4)
+        # All PLC I/O from async code funnels through this single worker:
+        # snap7's client is not thread-safe and one worker keeps the S7
+        # session serialized while the event loop awaits instead of blocking
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="plc")
+
+    async def run(self, fn, *args):
+        """Run a blocking PLC call on the connector's worker thread"""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    def submit(self, fn, *args):
+        """Queue a blocking PLC call on the worker thread without waiting
+
+        Fire-and-forget submission for callers that don't need the result,
+        such as the safety stop on client disconnect - the handler returns
+        immediately while the write drains through the single worker in
+        order. Returns the Future for callers that later want to check it."""
+        return self.executor.submit(fn, *args)
 
     @property
     def connected(self) -> bool:
@@ -115,7 +142,7 @@ class PLCConnector:
         try:
             with self.lock:
                 data = self.client.db_read(db_number, offset, 4)
-                return get_real(data, 0)
+                return _REAL.unpack(data)[0]
         except Exception as e:
             logger.error(f"Error reading Real from DB{db_number}.{offset}: {e}")
             return None
@@ -126,9 +153,8 @@ class PLCConnector:
             return False
         try:
             with self.lock:
-                data = bytearray(4)
-                set_real(data, 0, value)
-                self.client.db_write(db_number, offset, data)
+                _REAL.pack_into(self._real_buf, 0, value)
+                self.client.db_write(db_number, offset, self._real_buf)
                 return True
         except Exception as e:
             logger.error(f"Error writing Real to DB{db_number}.{offset}: {e}")
@@ -161,6 +187,49 @@ class PLCConnector:
             logger.error(f"Error writing Bool to DB{db_number}.DBX{byte_offset}.{bit_offset}: {e}")
             return False
 
+    def read_bytes(self, db_number: int, offset: int, size: int) -> Optional[bytearray]:
+        """Read a raw byte range from DB in one transaction"""
+        if not self.connected:
+            return None
+        try:
+            with self.lock:
+                return self.client.db_read(db_number, offset, size)
+        except Exception as e:
+            logger.error(f"Error reading {size} bytes from DB{db_number}.{offset}: {e}")
+            return None
+
+    def write_bytes(self, db_number: int, offset: int, data: bytearray) -> bool:
+        """Write a raw byte range to DB in one transaction"""
+        if not self.connected:
+            return False
+        try:
+            with self.lock:
+                self.client.db_write(db_number, offset, data)
+                return True
+        except Exception as e:
+            logger.error(f"Error writing {len(data)} bytes to DB{db_number}.{offset}: {e}")
+            return False
+
+    def write_bits(self, db_number: int, byte_offset: int, bits: dict) -> bool:
+        """Write several Bool values in the same DB byte in one transaction
+
+        `bits` maps bit offset (0-7) to the desired value. One read-modify-write
+        covers all of them, instead of one S7 round-trip per bit.
+        """
+        if not self.connected:
+            return False
+        try:
+            with self.lock:
+                # Read current byte first to preserve other bits
+                data = self.client.db_read(db_number, byte_offset, 1)
+                for bit_offset, value in bits.items():
+                    set_bool(data, 0, bit_offset, value)
+                self.client.db_write(db_number, byte_offset, data)
+                return True
+        except Exception as e:
+            logger.error(f"Error writing bits to DB{db_number}.DBB{byte_offset}: {e}")
+            return False
+
     def read_int(self, db_number: int, offset: int) -> Optional[int]:
         """Read an Int (16-bit) value from DB"""
         if not self.connected:
@@ -168,7 +237,7 @@ class PLCConnector:
         try:
             with self.lock:
                 data = self.client.db_read(db_number, offset, 2)
-                return get_int(data, 0)
+                return _INT.unpack(data)[0]
         except Exception as e:
             logger.error(f"Error reading Int from DB{db_number}.{offset}: {e}")
             return None
@@ -248,7 +317,7 @@ class PLCConnector:
         try:
             with self.lock:
                 data = self.client.read_area(Areas.PE, 0, address, 2)
-                return get_int(data, 0)
+                return _INT.unpack(data)[0]
         except Exception as e:
             self._handle_connection_error(e)
             logger.error(f"Error reading analog input IW{address}: {e}")
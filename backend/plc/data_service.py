@@ -1,10 +1,43 @@
-from typing import Dict, Any, Optional
+import copy
+import struct
+import time
+from typing import Dict, Any
 from .connector import PLCConnector
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Precompiled big-endian codecs for S7 REAL and INT - the format string is
+# parsed once here instead of on every decoded field
+_R = struct.Struct('>f')
+_I16 = struct.Struct('>h')
+
+
+# Field decoders for bulk-read DB buffers
+def _real(buf, offset: int) -> float:
+    """Decode a REAL (32-bit float) from a buffer"""
+    return _R.unpack_from(buf, offset)[0]
+
+
+def _int(buf, offset: int) -> int:
+    """Decode an INT (16-bit signed) from a buffer"""
+    return _I16.unpack_from(buf, offset)[0]
+
+
+def _bit(buf, byte_offset: int, bit_offset: int) -> bool:
+    """Decode a BOOL from a buffer"""
+    return bool(buf[byte_offset] & (1 << bit_offset))
+
+
+# 256-entry lookup decoding the seven DB3 byte-25 status flags (remote,
+# e-stop, upper limit, lower limit, home, safety ok, motion allowed) as
+# one index instead of seven shift-and-mask expressions per poll
+_DB3_B25_LUT = tuple(
+    tuple(bool(b & (1 << n)) for n in range(7)) for b in range(256)
+)
+
+
 class DataService:
     """Service for reading data from PLC
     
@@ -36,6 +69,21 @@ class DataService:
     PARAM_RETURN_SPEED = 50
     PARAM_APPROACH_DISTANCE = 54
 
+    # name -> DB1 offset, drives get_parameters' decode loop
+    _PARAM_FIELDS = (
+        ("pipe_diameter", PARAM_PIPE_DIAMETER),
+        ("pipe_length", PARAM_PIPE_LENGTH),
+        ("deflection_percent", PARAM_DEFLECTION_PERCENT),
+        ("deflection_target", PARAM_DEFLECTION_TARGET),
+        ("test_speed", PARAM_TEST_SPEED),
+        ("max_stroke", PARAM_MAX_STROKE),
+        ("max_force", PARAM_MAX_FORCE),
+        ("preload_force", PARAM_PRELOAD_FORCE),
+        ("approach_speed", PARAM_APPROACH_SPEED),
+        ("contact_speed", PARAM_CONTACT_SPEED),
+        ("return_speed", PARAM_RETURN_SPEED),
+    )
+
     # ═══════════════════════════════════════════════════════════════════
     # DB2 - TEST RESULTS (Read)
     # ═══════════════════════════════════════════════════════════════════
@@ -127,175 +175,25 @@ class DataService:
     HMI_HOME_STATUS = (60, 3)
     HMI_TEST_PROGRESS = 62
 
-    def __init__(self, plc: PLCConnector):
-        self.plc = plc
+    # Live-data reads within this window return the memoized payload - the
+    # PLC cycle is ~10 ms, so a 50 ms TTL absorbs duplicate UI-driven calls
+    # without serving data stale by more than a few cycles
+    LIVE_CACHE_TTL = 0.05  # seconds
 
-    def get_live_data(self) -> Dict[str, Any]:
-        """Read all real-time values from PLC"""
-        if not self.plc.connected:
-            return self._get_disconnected_data()
+    # CPU state rarely changes but costs its own S7 round-trip - refresh
+    # it at most once a second
+    CPU_STATE_TTL = 1.0  # seconds
 
-        try:
-            return {
-                # ═══════════════════════════════════════════════════════════
-                # FORCE READINGS (DB2)
-                # ═══════════════════════════════════════════════════════════
-                "force": {
-                    "raw": self.plc.read_real(self.DB_RESULTS, self.RES_LOAD_CELL_RAW) or 0.0,
-                    "actual": self.plc.read_real(self.DB_RESULTS, self.RES_LOAD_CELL_ACTUAL) or 0.0,
-                    "filtered": self.plc.read_real(self.DB_RESULTS, self.RES_FORCE_FILTERED) or 0.0,
-                    "kN": self.plc.read_real(self.DB_RESULTS, self.RES_FORCE_KN) or 0.0,
-                    "N": self.plc.read_real(self.DB_RESULTS, self.RES_ACTUAL_FORCE) or 0.0,
-                },
-                
-                # ═══════════════════════════════════════════════════════════
-                # POSITION READINGS (DB2 + DB3)
-                # ═══════════════════════════════════════════════════════════
-                "position": {
-                    "raw": self.plc.read_real(self.DB_RESULTS, self.RES_POSITION_RAW) or 0.0,
-                    "actual": self.plc.read_real(self.DB_RESULTS, self.RES_POSITION_ACTUAL) or 0.0,
-                    "servo": self.plc.read_real(self.DB_SERVO, self.VAL_ACTUAL_POSITION) or 0.0,
-                    "target": self.plc.read_real(self.DB_SERVO, self.VAL_TARGET_POSITION) or 0.0,
-                },
-                
-                # ═══════════════════════════════════════════════════════════
-                # DEFLECTION (DB2 + DB1)
-                # ═══════════════════════════════════════════════════════════
-                "deflection": {
-                    "actual": self.plc.read_real(self.DB_RESULTS, self.RES_ACTUAL_DEFLECTION) or 0.0,
-                    "percent": self.plc.read_real(self.DB_RESULTS, self.RES_DEFLECTION_PERCENT) or 0.0,
-                    "target": self.plc.read_real(self.DB_PARAMS, self.PARAM_DEFLECTION_TARGET) or 0.0,
-                },
-                
-                # ═══════════════════════════════════════════════════════════
-                # TEST STATUS (DB2 + DB4)
-                # ═══════════════════════════════════════════════════════════
-                "test": {
-                    "status": self.plc.read_int(self.DB_RESULTS, self.RES_TEST_STATUS) or 0,
-                    "stage": self.plc.read_int(self.DB_RESULTS, self.RES_TEST_STAGE) or 0,
-                    "progress": self.plc.read_int(self.DB_HMI, self.HMI_TEST_PROGRESS) or 0,
-                    "recording": self.plc.read_bool(self.DB_RESULTS, *self.RES_RECORDING_ACTIVE) or False,
-                    "preload_reached": self.plc.read_bool(self.DB_RESULTS, *self.RES_PRELOAD_REACHED) or False,
-                    "passed": self.plc.read_bool(self.DB_RESULTS, *self.RES_TEST_PASSED) or False,
-                },
-                
-                # ═══════════════════════════════════════════════════════════
-                # RESULTS (DB2)
-                # ═══════════════════════════════════════════════════════════
-                "results": {
-                    "ring_stiffness": self.plc.read_real(self.DB_RESULTS, self.RES_RING_STIFFNESS) or 0.0,
-                    "force_at_target": self.plc.read_real(self.DB_RESULTS, self.RES_FORCE_AT_TARGET) or 0.0,
-                    "sn_class": self.plc.read_int(self.DB_RESULTS, self.RES_SN_CLASS) or 0,
-                    "contact_position": self.plc.read_real(self.DB_RESULTS, self.RES_CONTACT_POSITION) or 0.0,
-                    "data_points": self.plc.read_int(self.DB_RESULTS, self.RES_DATA_POINT_COUNT) or 0,
-                },
-                
-                # ═══════════════════════════════════════════════════════════
-                # SERVO STATUS (DB3)
-                # ═══════════════════════════════════════════════════════════
-                "servo": {
-                    "ready": self.plc.read_bool(self.DB_SERVO, *self.STATUS_SERVO_READY) or False,
-                    "error": self.plc.read_bool(self.DB_SERVO, *self.STATUS_SERVO_ERROR) or False,
-                    "enabled": self.plc.read_bool(self.DB_SERVO, *self.STATUS_ENABLE) or False,
-                    "at_home": self.plc.read_bool(self.DB_SERVO, *self.STATUS_AT_HOME) or False,
-                    "mc_power": self.plc.read_bool(self.DB_SERVO, *self.STATUS_MC_POWER) or False,
-                    "mc_busy": self.plc.read_bool(self.DB_SERVO, *self.STATUS_MC_BUSY) or False,
-                    "mc_error": self.plc.read_bool(self.DB_SERVO, *self.STATUS_MC_ERROR) or False,
-                    "speed": self.plc.read_real(self.DB_SERVO, self.VAL_ACTUAL_SPEED) or 0.0,
-                    "jog_velocity": self.plc.read_real(self.DB_SERVO, self.VAL_JOG_VELOCITY) or 0.0,
-                },
-                
-                # ═══════════════════════════════════════════════════════════
-                # STEP MOVEMENT STATUS (DB3) - NEW
-                # ═══════════════════════════════════════════════════════════
-                "step": {
-                    "distance": self.plc.read_real(self.DB_SERVO, self.STEP_DISTANCE) or 0.0,
-                    "forward_cmd": self.plc.read_bool(self.DB_SERVO, *self.STEP_FORWARD) or False,
-                    "backward_cmd": self.plc.read_bool(self.DB_SERVO, *self.STEP_BACKWARD) or False,
-                    "active": self.plc.read_bool(self.DB_SERVO, *self.STEP_ACTIVE) or False,
-                    "done": self.plc.read_bool(self.DB_SERVO, *self.STEP_DONE) or False,
-                },
-                
-                # ═══════════════════════════════════════════════════════════
-                # SAFETY STATUS (DB3)
-                # ═══════════════════════════════════════════════════════════
-                "safety": {
-                    "e_stop": self.plc.read_bool(self.DB_SERVO, *self.STATUS_ESTOP_ACTIVE) or False,
-                    "upper_limit": self.plc.read_bool(self.DB_SERVO, *self.STATUS_UPPER_LIMIT) or False,
-                    "lower_limit": self.plc.read_bool(self.DB_SERVO, *self.STATUS_LOWER_LIMIT) or False,
-                    "home": self.plc.read_bool(self.DB_SERVO, *self.STATUS_HOME_POSITION) or False,
-                    "ok": self.plc.read_bool(self.DB_SERVO, *self.STATUS_SAFETY_OK) or False,
-                    "motion_allowed": self.plc.read_bool(self.DB_SERVO, *self.STATUS_MOTION_ALLOWED) or False,
-                },
-                
-                # ═══════════════════════════════════════════════════════════
-                # CLAMPS (DB3)
-                # ═══════════════════════════════════════════════════════════
-                "clamps": {
-                    "upper": self.plc.read_bool(self.DB_SERVO, *self.STATUS_LOCK_UPPER) or False,
-                    "lower": self.plc.read_bool(self.DB_SERVO, *self.STATUS_LOCK_LOWER) or False,
-                },
-                
-                # ═══════════════════════════════════════════════════════════
-                # MODE (DB3)
-                # ═══════════════════════════════════════════════════════════
-                "mode": {
-                    "remote": self.plc.read_bool(self.DB_SERVO, *self.STATUS_REMOTE_MODE) or False,
-                    "can_change": self.plc.read_bool(self.DB_SERVO, *self.STATUS_MODE_CHANGE_OK) or False,
-                },
-                
-                # ═══════════════════════════════════════════════════════════
-                # ALARMS (DB4)
-                # ═══════════════════════════════════════════════════════════
-                "alarm": {
-                    "active": self.plc.read_bool(self.DB_HMI, *self.HMI_ALARM_ACTIVE) or False,
-                    "code": self.plc.read_int(self.DB_HMI, self.HMI_ALARM_CODE) or 0,
-                },
-                
-                # ═══════════════════════════════════════════════════════════
-                # LAMPS (DB4)
-                # ═══════════════════════════════════════════════════════════
-                "lamps": {
-                    "ready": self.plc.read_bool(self.DB_HMI, *self.HMI_LAMP_READY) or False,
-                    "running": self.plc.read_bool(self.DB_HMI, *self.HMI_LAMP_RUNNING) or False,
-                    "error": self.plc.read_bool(self.DB_HMI, *self.HMI_LAMP_ERROR) or False,
-                },
-                
-                # ═══════════════════════════════════════════════════════════
-                # PLC CONNECTION
-                # ═══════════════════════════════════════════════════════════
-                "connected": True,
-                "plc": {
-                    "connected": True,
-                    "cpu_state": self.plc.get_cpu_state(),
-                    "ip": self.plc.ip
-                },
-                
-                # ═══════════════════════════════════════════════════════════
-                # LEGACY COMPATIBILITY
-                # ═══════════════════════════════════════════════════════════
-                "servo_ready": self.plc.read_bool(self.DB_SERVO, *self.STATUS_SERVO_READY) or False,
-                "servo_error": self.plc.read_bool(self.DB_SERVO, *self.STATUS_SERVO_ERROR) or False,
-                "servo_enabled": self.plc.read_bool(self.DB_SERVO, *self.STATUS_ENABLE) or False,
-                "at_home": self.plc.read_bool(self.DB_SERVO, *self.STATUS_AT_HOME) or False,
-                "lock_upper": self.plc.read_bool(self.DB_SERVO, *self.STATUS_LOCK_UPPER) or False,
-                "lock_lower": self.plc.read_bool(self.DB_SERVO, *self.STATUS_LOCK_LOWER) or False,
-                "remote_mode": self.plc.read_bool(self.DB_SERVO, *self.STATUS_REMOTE_MODE) or False,
-                "e_stop_active": self.plc.read_bool(self.DB_SERVO, *self.STATUS_ESTOP_ACTIVE) or False,
-                "actual_position": self.plc.read_real(self.DB_SERVO, self.VAL_ACTUAL_POSITION) or 0.0,
-                "actual_force": (self.plc.read_real(self.DB_RESULTS, self.RES_FORCE_KN) or 0.0),
-                "actual_deflection": self.plc.read_real(self.DB_RESULTS, self.RES_ACTUAL_DEFLECTION) or 0.0,
-                "target_deflection": self.plc.read_real(self.DB_PARAMS, self.PARAM_DEFLECTION_TARGET) or 0.0,
-                "test_status": self.plc.read_int(self.DB_RESULTS, self.RES_TEST_STATUS) or 0,
-                "test_progress": self.plc.read_int(self.DB_HMI, self.HMI_TEST_PROGRESS) or 0,
-            }
-        except Exception as e:
-            logger.error(f"Error reading live data: {e}")
-            return self._get_disconnected_data()
-
-    def _get_disconnected_data(self) -> Dict[str, Any]:
-        """Default values when disconnected"""
-        return {
+    def __init__(self, plc: PLCConnector):
+        self.plc = plc
+        self._live_cache = None
+        self._live_cache_ts = 0.0
+        self._cpu_state = "unknown"
+        self._cpu_state_ts = 0.0
+        # The disconnected payload is constant apart from the PLC ip -
+        # build it once instead of reallocating ~15 dicts on every
+        # disconnected poll and exception path
+        self._disconnected_data = {
             "force": {"raw": 0.0, "actual": 0.0, "filtered": 0.0, "kN": 0.0, "N": 0.0},
             "position": {"raw": 0.0, "actual": 0.0, "servo": 0.0, "target": 0.0},
             "deflection": {"actual": 0.0, "percent": 0.0, "target": 0.0},
@@ -309,32 +207,218 @@ class DataService:
             "alarm": {"active": False, "code": 0},
             "lamps": {"ready": False, "running": False, "error": False},
             "connected": False,
-            "plc": {"connected": False, "cpu_state": "unknown", "ip": self.plc.ip},
+            "plc": {"connected": False, "cpu_state": "unknown", "ip": plc.ip},
             "servo_ready": False, "servo_error": False, "servo_enabled": False,
             "at_home": False, "lock_upper": False, "lock_lower": False,
             "remote_mode": False, "e_stop_active": False,
             "actual_position": 0.0, "actual_force": 0.0, "actual_deflection": 0.0,
             "target_deflection": 0.0, "test_status": -1, "test_progress": 0,
         }
+        # Mutable live-data payload, same shape as the disconnected template -
+        # get_live_data overwrites the leaf values in place instead of
+        # allocating ~15 fresh dicts per poll tick
+        self._live = copy.deepcopy(self._disconnected_data)
+        self._live["connected"] = True
+        self._live["plc"] = {"connected": True, "cpu_state": "unknown", "ip": plc.ip}
+
+    def get_live_data(self) -> Dict[str, Any]:
+        """Read all real-time values from PLC
+
+        One bulk db_read per data block instead of one request per field -
+        each S7 round-trip costs ~10 ms, so fetching DB1/DB2/DB3/DB4 as
+        four buffers and decoding locally collapses ~50 round-trips into 4.
+        """
+        now = time.monotonic()
+        if self._live_cache is not None and now - self._live_cache_ts < self.LIVE_CACHE_TTL:
+            return self._live_cache
+
+        if not self.plc.connected:
+            return self._get_disconnected_data()
+
+        # DB1: only the deflection target is needed, DB2/DB3/DB4 wholesale
+        db1 = self.plc.read_bytes(self.DB_PARAMS, self.PARAM_DEFLECTION_TARGET, 4)
+        db2 = self.plc.read_bytes(self.DB_RESULTS, 0, 86)
+        db3 = self.plc.read_bytes(self.DB_SERVO, 0, 37)
+        db4 = self.plc.read_bytes(self.DB_HMI, 0, 64)
+        if db1 is None or db2 is None or db3 is None or db4 is None:
+            return self._get_disconnected_data()
+
+        try:
+            # Values that appear in both the nested sections and the legacy
+            # flat keys are decoded once here and referenced twice
+            servo_ready = _bit(db3, 0, 7)
+            servo_error = _bit(db3, 1, 0)
+            servo_enabled = _bit(db3, 0, 0)
+            at_home = _bit(db3, 1, 1)
+            lock_upper = _bit(db3, 14, 0)
+            lock_lower = _bit(db3, 14, 1)
+            (remote_mode, e_stop_active, upper_limit, lower_limit,
+             home_position, safety_ok, motion_allowed) = _DB3_B25_LUT[db3[25]]
+            actual_position = _real(db3, 2)
+            force_kn = _real(db2, 44)
+            actual_deflection = _real(db2, 4)
+            target_deflection = _real(db1, 0)  # buffer starts at PARAM_DEFLECTION_TARGET
+            test_status = _int(db2, 22)
+            test_progress = _int(db4, 62)
+
+            live = self._live
+
+            # FORCE READINGS (DB2)
+            force = live["force"]
+            force["raw"] = _real(db2, 48)
+            force["actual"] = _real(db2, 56)
+            force["filtered"] = _real(db2, 36)
+            force["kN"] = force_kn
+            force["N"] = _real(db2, 0)
+
+            # POSITION READINGS (DB2 + DB3)
+            position = live["position"]
+            position["raw"] = _real(db2, 62)
+            position["actual"] = _real(db2, 70)
+            position["servo"] = actual_position
+            position["target"] = _real(db3, 6)
+
+            # DEFLECTION (DB2 + DB1)
+            deflection = live["deflection"]
+            deflection["actual"] = actual_deflection
+            deflection["percent"] = _real(db2, 8)
+            deflection["target"] = target_deflection
+
+            # TEST STATUS (DB2 + DB4)
+            test = live["test"]
+            test["status"] = test_status
+            test["stage"] = _int(db2, 74)
+            test["progress"] = test_progress
+            test["recording"] = _bit(db2, 84, 0)
+            test["preload_reached"] = _bit(db2, 76, 0)
+            test["passed"] = _bit(db2, 24, 0)
+
+            # RESULTS (DB2)
+            results = live["results"]
+            results["ring_stiffness"] = _real(db2, 16)
+            results["force_at_target"] = _real(db2, 12)
+            results["sn_class"] = _int(db2, 20)
+            results["contact_position"] = _real(db2, 78)
+            results["data_points"] = _int(db2, 82)
+
+            # SERVO STATUS (DB3)
+            servo = live["servo"]
+            servo["ready"] = servo_ready
+            servo["error"] = servo_error
+            servo["enabled"] = servo_enabled
+            servo["at_home"] = at_home
+            servo["mc_power"] = _bit(db3, 20, 0)
+            servo["mc_busy"] = _bit(db3, 20, 1)
+            servo["mc_error"] = _bit(db3, 20, 2)
+            servo["speed"] = _real(db3, 10)
+            servo["jog_velocity"] = _real(db3, 16)
+
+            # STEP MOVEMENT STATUS (DB3)
+            step = live["step"]
+            step["distance"] = _real(db3, 32)
+            step["forward_cmd"] = _bit(db3, 36, 0)
+            step["backward_cmd"] = _bit(db3, 36, 1)
+            step["active"] = _bit(db3, 36, 2)
+            step["done"] = _bit(db3, 36, 3)
+
+            # SAFETY STATUS (DB3)
+            safety = live["safety"]
+            safety["e_stop"] = e_stop_active
+            safety["upper_limit"] = upper_limit
+            safety["lower_limit"] = lower_limit
+            safety["home"] = home_position
+            safety["ok"] = safety_ok
+            safety["motion_allowed"] = motion_allowed
+
+            # CLAMPS (DB3)
+            clamps = live["clamps"]
+            clamps["upper"] = lock_upper
+            clamps["lower"] = lock_lower
+
+            # MODE (DB3)
+            mode = live["mode"]
+            mode["remote"] = remote_mode
+            mode["can_change"] = _bit(db3, 30, 0)
+
+            # ALARMS (DB4)
+            alarm = live["alarm"]
+            alarm["active"] = _bit(db4, 2, 2)
+            alarm["code"] = _int(db4, 4)
+
+            # LAMPS (DB4)
+            lamps = live["lamps"]
+            lamps["ready"] = _bit(db4, 59, 3)
+            lamps["running"] = _bit(db4, 59, 4)
+            lamps["error"] = _bit(db4, 59, 5)
+
+            # PLC CONNECTION
+            if now - self._cpu_state_ts >= self.CPU_STATE_TTL:
+                self._cpu_state = self.plc.get_cpu_state()
+                self._cpu_state_ts = now
+            live["plc"]["cpu_state"] = self._cpu_state
+
+            # LEGACY COMPATIBILITY
+            live["servo_ready"] = servo_ready
+            live["servo_error"] = servo_error
+            live["servo_enabled"] = servo_enabled
+            live["at_home"] = at_home
+            live["lock_upper"] = lock_upper
+            live["lock_lower"] = lock_lower
+            live["remote_mode"] = remote_mode
+            live["e_stop_active"] = e_stop_active
+            live["actual_position"] = actual_position
+            live["actual_force"] = force_kn
+            live["actual_deflection"] = actual_deflection
+            live["target_deflection"] = target_deflection
+            live["test_status"] = test_status
+            live["test_progress"] = test_progress
+
+            self._live_cache = live
+            self._live_cache_ts = now
+            return live
+        except Exception as e:
+            logger.error(f"Error reading live data: {e}")
+            return self._get_disconnected_data()
+
+    def get_live_data_copy(self) -> Dict[str, Any]:
+        """Isolated snapshot of the live payload
+
+        get_live_data hands out a shared template that the next poll
+        mutates in place, which is only safe for the broadcaster's
+        read-serialize-emit sequence on the connector worker. Callers that
+        hold onto the data (REST status, test recording) get a deep copy
+        instead; run this through PLCConnector.run so the read and the
+        copy both happen on the worker, never mid-poll.
+        """
+        return copy.deepcopy(self.get_live_data())
+
+    def invalidate_live_cache(self) -> None:
+        """Drop the memoized live payload so the next read hits the PLC
+
+        Called after a successful command write - the broadcaster is woken
+        at the same time and must not be served the pre-write payload.
+        """
+        self._live_cache = None
+
+    def _get_disconnected_data(self) -> Dict[str, Any]:
+        """Default values when disconnected
+
+        Returns the shared prebuilt payload - callers read and serialize
+        it, they must not mutate it.
+        """
+        return self._disconnected_data
 
     def get_parameters(self) -> Dict[str, Any]:
         if not self.plc.connected:
             return self._get_default_parameters()
         try:
-            return {
-                "pipe_diameter": self.plc.read_real(self.DB_PARAMS, self.PARAM_PIPE_DIAMETER) or 0.0,
-                "pipe_length": self.plc.read_real(self.DB_PARAMS, self.PARAM_PIPE_LENGTH) or 300.0,
-                "deflection_percent": self.plc.read_real(self.DB_PARAMS, self.PARAM_DEFLECTION_PERCENT) or 3.0,
-                "deflection_target": self.plc.read_real(self.DB_PARAMS, self.PARAM_DEFLECTION_TARGET) or 0.0,
-                "test_speed": self.plc.read_real(self.DB_PARAMS, self.PARAM_TEST_SPEED) or 12.0,
-                "max_stroke": self.plc.read_real(self.DB_PARAMS, self.PARAM_MAX_STROKE) or 100.0,
-                "max_force": self.plc.read_real(self.DB_PARAMS, self.PARAM_MAX_FORCE) or 50000.0,
-                "preload_force": self.plc.read_real(self.DB_PARAMS, self.PARAM_PRELOAD_FORCE) or 10.0,
-                "approach_speed": self.plc.read_real(self.DB_PARAMS, self.PARAM_APPROACH_SPEED) or 50.0,
-                "contact_speed": self.plc.read_real(self.DB_PARAMS, self.PARAM_CONTACT_SPEED) or 2.0,
-                "return_speed": self.plc.read_real(self.DB_PARAMS, self.PARAM_RETURN_SPEED) or 100.0,
-                "connected": True,
-            }
+            # All parameters sit in DB1 bytes 0..57 - one transfer
+            db1 = self.plc.read_bytes(self.DB_PARAMS, 0, 58)
+            if db1 is None:
+                return self._get_default_parameters()
+            params = {name: _real(db1, offset) for name, offset in self._PARAM_FIELDS}
+            params["connected"] = True
+            return params
         except Exception as e:
             logger.error(f"Error reading parameters: {e}")
             return self._get_default_parameters()
@@ -363,6 +447,9 @@ class DataService:
                 self.plc.write_real(self.DB_PARAMS, self.PARAM_MAX_FORCE, float(kwargs["max_force"]))
             if "preload_force" in kwargs:
                 self.plc.write_real(self.DB_PARAMS, self.PARAM_PRELOAD_FORCE, float(kwargs["preload_force"]))
+            # Parameters feed the live payload (deflection target) - drop the
+            # memoized copy so the next poll reflects the write immediately
+            self.invalidate_live_cache()
             logger.info(f"Parameters written: {kwargs}")
             return True
         except Exception as e:
@@ -370,12 +457,14 @@ class DataService:
             return False
 
     def get_test_results(self) -> Dict[str, Any]:
-        if not self.plc.connected:
+        # The result fields sit in DB2 bytes 0..24 - one transfer
+        db2 = self.plc.read_bytes(self.DB_RESULTS, 0, 26) if self.plc.connected else None
+        if db2 is None:
             return {"ring_stiffness": 0.0, "force_at_target": 0.0, "sn_class": 0, "test_passed": False}
         return {
-            "ring_stiffness": self.plc.read_real(self.DB_RESULTS, self.RES_RING_STIFFNESS) or 0.0,
-            "force_at_target": self.plc.read_real(self.DB_RESULTS, self.RES_FORCE_AT_TARGET) or 0.0,
-            "sn_class": self.plc.read_int(self.DB_RESULTS, self.RES_SN_CLASS) or 0,
-            "test_passed": self.plc.read_bool(self.DB_RESULTS, *self.RES_TEST_PASSED) or False,
-            "deflection_percent": self.plc.read_real(self.DB_RESULTS, self.RES_DEFLECTION_PERCENT) or 0.0,
+            "ring_stiffness": _real(db2, 16),
+            "force_at_target": _real(db2, 12),
+            "sn_class": _int(db2, 20),
+            "test_passed": _bit(db2, 24, 0),
+            "deflection_percent": _real(db2, 8),
         }
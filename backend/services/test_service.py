@@ -88,7 +88,8 @@ class TestService:
         """Background task to record test data points"""
         while self.is_recording:
             try:
-                data = self.data_service.get_live_data()
+                data = await self.data_service.plc.run(
+                    self.data_service.get_live_data_copy)
                 current_time = asyncio.get_event_loop().time()
 
                 self.data_points.append({
@@ -11,7 +11,7 @@ class SocketClient {
     if (this.socket?.connected) return;
 
     this.socket = io(SOCKET_URL, {
-      transports: ['websocket', 'polling'],
+      transports: ['websocket'],
       path: '/socket.io',
     });
 